@@ -0,0 +1,182 @@
+"""
+Benchmark gzip request-body compression in make_request.
+
+Sends representative users/track and catalog item payloads through
+make_request against a mock transport that simulates a link of limited
+bandwidth, with and without Content-Encoding: gzip, and reports the bytes
+saved and the end-to-end latency of each.
+
+Run from the repository root with the package installed (pip install -e .).
+No Braze API key is needed and nothing leaves the machine:
+
+    python benchmarks/gzip_request_bodies.py [--bandwidth-mbps 20] [--rtt-ms 40] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import gzip
+import random
+import statistics
+import string
+import time
+
+import httpx
+
+from braze_mcp_write.utils.http import CompressionPolicy, make_request
+from braze_mcp_write.utils.serialization import JSON_BACKEND, encode_json
+
+BASE_URL = "https://rest.benchmark.braze.invalid"
+
+
+# ============================================================================
+# PAYLOADS
+# ============================================================================
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(count)
+    )
+
+
+def users_track_payload(rng: random.Random) -> dict:
+    """One full users/track request: 75 attribute objects with typical profile fields."""
+    return {
+        "attributes": [
+            {
+                "external_id": f"user-{i:08d}",
+                "first_name": _words(rng, 1).title(),
+                "last_name": _words(rng, 1).title(),
+                "email": f"user{i}@example.com",
+                "country": rng.choice(["US", "GB", "DE", "FR", "BR", "JP"]),
+                "language": rng.choice(["en", "de", "fr", "pt", "ja"]),
+                "loyalty_tier": rng.choice(["bronze", "silver", "gold", "platinum"]),
+                "lifetime_value": round(rng.uniform(0, 5000), 2),
+                "favorite_categories": rng.sample(["shoes", "bags", "hats", "coats", "socks"], 3),
+                "email_subscribe": rng.choice(["opted_in", "subscribed", "unsubscribed"]),
+                "last_order_at": f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:00:00Z",
+            }
+            for i in range(75)
+        ]
+    }
+
+
+def catalog_items_payload(rng: random.Random, count: int = 50) -> dict:
+    """Catalog item upsert with product descriptions (50 items per Braze request)."""
+    return {
+        "items": [
+            {
+                "id": f"sku-{i:08d}",
+                "name": _words(rng, 4).title(),
+                "description": _words(rng, 60),
+                "price": round(rng.uniform(5, 500), 2),
+                "in_stock": rng.random() > 0.2,
+                "image_url": f"https://cdn.example.com/products/sku-{i:08d}.jpg",
+                "tags": rng.sample(["new", "sale", "summer", "winter", "limited", "eco"], 2),
+            }
+            for i in range(count)
+        ]
+    }
+
+
+PAYLOADS = {
+    "users/track (75 attributes)": ("users/track", "POST", users_track_payload),
+    "catalog items (50 items)": ("catalogs/products/items", "PUT", catalog_items_payload),
+    "catalog items (~10 MB)": (
+        "catalogs/products/items",
+        "PUT",
+        lambda rng: catalog_items_payload(rng, count=16000),
+    ),
+}
+
+
+# ============================================================================
+# SIMULATED LINK
+# ============================================================================
+
+
+def simulated_transport(bandwidth_mbps: float, rtt_ms: float) -> httpx.MockTransport:
+    """Mock Braze endpoint whose response time grows with the bytes uploaded."""
+    bytes_per_second = bandwidth_mbps * 1_000_000 / 8
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = request.content
+        await asyncio.sleep(rtt_ms / 1000 + len(body) / bytes_per_second)
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return httpx.Response(201, json={"message": "success", "received_bytes": len(body)})
+
+    return httpx.MockTransport(handler)
+
+
+async def time_request(
+    client: httpx.AsyncClient, url_path: str, method: str, body: bytes, policy: CompressionPolicy
+) -> float:
+    start = time.perf_counter()
+    response = await make_request(
+        client, BASE_URL, url_path, body=body, method=method, compression=policy
+    )
+    elapsed = time.perf_counter() - start
+    assert response.json()["received_bytes"] == len(body)
+    return elapsed
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    plain = CompressionPolicy(enabled=False)
+    compressed = CompressionPolicy(enabled=True, min_bytes=0, level=args.level)
+
+    print(
+        f"JSON backend: {JSON_BACKEND}, gzip level {args.level}, "
+        f"simulated link {args.bandwidth_mbps} Mbit/s with {args.rtt_ms} ms RTT, "
+        f"median of {args.repeat} runs\n"
+    )
+    header = (
+        f"{'payload':<30}{'raw bytes':>12}{'gzip bytes':>12}{'saved':>8}"
+        f"{'gzip ms':>9}{'raw ms':>9}{'gzip e2e ms':>13}{'speedup':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    async with httpx.AsyncClient(
+        transport=simulated_transport(args.bandwidth_mbps, args.rtt_ms)
+    ) as client:
+        for name, (url_path, method, build) in PAYLOADS.items():
+            body = encode_json(build(rng))
+
+            start = time.perf_counter()
+            gzipped = gzip.compress(body, args.level, mtime=0)
+            compress_ms = (time.perf_counter() - start) * 1000
+
+            raw_times = [
+                await time_request(client, url_path, method, body, plain)
+                for _ in range(args.repeat)
+            ]
+            gzip_times = [
+                await time_request(client, url_path, method, body, compressed)
+                for _ in range(args.repeat)
+            ]
+            raw_ms = statistics.median(raw_times) * 1000
+            gzip_ms = statistics.median(gzip_times) * 1000
+
+            print(
+                f"{name:<30}{len(body):>12,}{len(gzipped):>12,}"
+                f"{1 - len(gzipped) / len(body):>8.0%}{compress_ms:>9.1f}"
+                f"{raw_ms:>9.1f}{gzip_ms:>13.1f}{raw_ms / gzip_ms:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--bandwidth-mbps", type=float, default=20.0, help="Simulated upload bandwidth"
+    )
+    parser.add_argument("--rtt-ms", type=float, default=40.0, help="Simulated round-trip time")
+    parser.add_argument("--level", type=int, default=6, help="Gzip compression level (1-9)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per payload and mode")
+    asyncio.run(main(parser.parse_args()))
@@ -1,19 +1,44 @@
 """
 Main entry point for Braze MCP Write Server.
+
+Usage:
+    braze-mcp-write                    Run the MCP server
+    braze-mcp-write build-manifest     Prebuild the function registry manifest
 """
 
+import argparse
 import sys
+from pathlib import Path
 
-from braze_mcp_write.server import mcp
 from braze_mcp_write.utils.logging import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
 
-def main():
-    """Main entry point for the server."""
-    configure_logging()
+def build_manifest(output: str | None = None, force: bool = False) -> None:
+    """
+    Prebuild the function registry manifest so server starts skip metadata extraction.
     
+    Args:
+        output: Manifest file path (defaults to BRAZE_REGISTRY_MANIFEST)
+        force: If True, re-parse every tool module even if unchanged
+    """
+    from braze_mcp_write.registry_builder import REGISTRY_MANIFEST_PATH, update_registry_manifest
+
+    path = Path(output) if output else REGISTRY_MANIFEST_PATH
+    manifest, _ = update_registry_manifest(path, force=force)
+
+    function_count = sum(len(entry["functions"]) for entry in manifest["modules"].values())
+    print(
+        f"Registry manifest {path}: {function_count} functions "
+        f"in {len(manifest['modules'])} modules"
+    )
+
+
+def run_server() -> None:
+    """Run the FastMCP server."""
+    from braze_mcp_write.server import mcp
+
     logger.info("Starting Braze MCP Write Server")
     
     try:
@@ -27,6 +52,30 @@ def main():
         sys.exit(1)
 
 
+def main():
+    """Main entry point for the server."""
+    parser = argparse.ArgumentParser(prog="braze-mcp-write", description="Braze MCP Write Server")
+    subcommands = parser.add_subparsers(dest="command")
+
+    manifest_parser = subcommands.add_parser(
+        "build-manifest", help="Prebuild the function registry manifest"
+    )
+    manifest_parser.add_argument(
+        "--output", help="Manifest file path (default: BRAZE_REGISTRY_MANIFEST)"
+    )
+    manifest_parser.add_argument(
+        "--force", action="store_true", help="Re-parse every tool module even if unchanged"
+    )
+
+    args = parser.parse_args()
+
+    configure_logging()
+
+    if args.command == "build-manifest":
+        build_manifest(args.output, args.force)
+    else:
+        run_server()
+
+
 if __name__ == "__main__":
     main()
-
@@ -6,6 +6,7 @@ from braze_mcp_write.models.errors import (
     function_not_found_error,
     internal_error,
     invalid_params_error,
+    model_not_found_error,
 )
 from braze_mcp_write.models.responses import (
     BrazeAPIResponse,
@@ -15,12 +16,20 @@ from braze_mcp_write.models.responses import (
     SendDataSeriesResponse,
     UserTrackResponse,
 )
+from braze_mcp_write.models.schemas import (
+    available_models,
+    describe_model_schema,
+    model_key,
+    model_schema,
+    schema_reference,
+)
 
 __all__ = [
     # Errors
     "function_not_found_error",
     "internal_error",
     "invalid_params_error",
+    "model_not_found_error",
     # Responses
     "BrazeAPIResponse",
     "CampaignResponse",
@@ -28,5 +37,11 @@ __all__ = [
     "CatalogResponse",
     "SendDataSeriesResponse",
     "UserTrackResponse",
+    # Schemas
+    "available_models",
+    "describe_model_schema",
+    "model_key",
+    "model_schema",
+    "schema_reference",
 ]
 
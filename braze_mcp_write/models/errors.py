@@ -26,6 +26,25 @@ def function_not_found_error(function_name: str, available_functions: list[str])
     }
 
 
+def model_not_found_error(model_name: str, available_models: list[str]) -> dict[str, Any]:
+    """
+    Create an error response for a model not found.
+    
+    Args:
+        model_name: Name of the model that was not found
+        available_models: List of model names that can be described
+    
+    Returns:
+        Error dictionary
+    """
+    return {
+        "error": "Model not found",
+        "model_name": model_name,
+        "message": f"Model '{model_name}' is not known",
+        "available_models": available_models,
+    }
+
+
 def invalid_params_error(message: str, operation: str) -> dict[str, Any]:
     """
     Create an error response for invalid parameters.
@@ -0,0 +1,105 @@
+"""
+JSON schemas of response models, computed once per model class.
+
+Function results that are Pydantic models reference their model by qualified
+name (module and class) and schema version; the schema itself is served on
+demand by describe_model.
+"""
+
+import hashlib
+import inspect
+import json
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from braze_mcp_write.models import responses
+
+
+def model_key(model: type[BaseModel]) -> str:
+    """Qualified name of a model class, unique even when class names repeat across modules."""
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+# Models that can be described by qualified name: the shared response models, plus
+# any other model once a function has returned it
+_MODELS: dict[str, type[BaseModel]] = {
+    model_key(model): model
+    for _, model in inspect.getmembers(responses, inspect.isclass)
+    if issubclass(model, BaseModel) and model.__module__ == responses.__name__
+}
+
+
+@lru_cache(maxsize=None)
+def model_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    JSON schema of a model class, generated on first use.
+
+    Args:
+        model: Pydantic model class
+
+    Returns:
+        The model's JSON schema (shared; do not modify)
+    """
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def model_version(model: type[BaseModel]) -> str:
+    """Content hash of a model's JSON schema."""
+    return hashlib.sha256(
+        json.dumps(model_schema(model), sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def schema_reference(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Reference to a model's schema for embedding in function results.
+
+    Args:
+        model: Pydantic model class of the result
+
+    Returns:
+        Dictionary with the model's qualified name, schema version and a pointer to describe_model
+    """
+    key = model_key(model)
+    _MODELS.setdefault(key, model)
+    return {
+        "model_name": key,
+        "version": model_version(model),
+        "description": (
+            f"Response data structured according to the {model.__name__} model "
+            "(use describe_model for its fields)"
+        ),
+    }
+
+
+def describe_model_schema(model_name: str) -> dict[str, Any] | None:
+    """
+    Schema of a model referenced by name.
+
+    Args:
+        model_name: Qualified name from a result's schema.model_name, or a bare class name
+            if only one known model has it
+
+    Returns:
+        Dictionary with the model name, version and JSON schema, or None if the model is
+        unknown or the bare name is ambiguous
+    """
+    model = _MODELS.get(model_name)
+    if model is None:
+        matches = [known for known in _MODELS.values() if known.__name__ == model_name]
+        if len(matches) != 1:
+            return None
+        model = matches[0]
+    return {
+        "model_name": model_key(model),
+        "version": model_version(model),
+        "fields": model_schema(model),
+    }
+
+
+def available_models() -> list[str]:
+    """Names of the models describe_model knows about."""
+    return sorted(_MODELS)
@@ -3,13 +3,28 @@ Registry builder for auto-discovering and registering MCP tools.
 
 This module uses reflection to scan braze_mcp_write.tools for modules with
 __register_mcp_tools__ = True and automatically extracts their metadata.
+The extracted metadata is persisted to a manifest so that later starts can
+build the registry without importing the tool modules.
 """
 
+import hashlib
 import importlib
+import importlib.util
 import inspect
 import json
+import os
 import pkgutil
-from typing import Any, Type, Union, get_args, get_origin, get_type_hints
+import re
+import textwrap
+import types
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal, Type, Union, get_args, get_origin, get_type_hints
+
+from mcp.server.fastmcp import Context
+from pydantic import BaseModel
 
 import braze_mcp_write.tools
 from braze_mcp_write.utils.logging import get_logger
@@ -68,35 +83,101 @@ BASIC_TYPE_MAPPING = {
 # ============================================================================
 
 
-def _python_type_to_json_type(python_type) -> str:
-    """Convert Python type hints to JSON schema types"""
+def _is_union(python_type) -> bool:
+    """Check for typing.Union / Optional and PEP 604 (X | Y) unions"""
+    return get_origin(python_type) is Union or isinstance(python_type, types.UnionType)
+
+
+def _python_type_to_json_schema(python_type) -> dict[str, Any]:
+    """Convert a Python type hint to a JSON Schema, including nested item types"""
     try:
         if python_type is type(None):
-            return "null"
+            return {"type": "null"}
+
+        if python_type is Any or python_type is object:
+            return {}
 
         origin = get_origin(python_type)
         args = get_args(python_type)
 
         # Handle Union types (including Optional[T])
-        if origin is Union or str(type(python_type)).endswith("UnionType'>"):
-            non_none_types = [t for t in args if t is not type(None)]
-            if non_none_types:
-                return _python_type_to_json_type(non_none_types[0])
-            return "null"
+        if _is_union(python_type):
+            nullable = type(None) in args
+            options = [_python_type_to_json_schema(t) for t in args if t is not type(None)]
+
+            if len(options) == 1:
+                schema = options[0]
+            else:
+                schema = {"anyOf": options}
+
+            if not nullable or not schema:
+                return schema
+            if isinstance(schema.get("type"), str):
+                return {**schema, "type": [schema["type"], "null"]}
+            if "anyOf" in schema:
+                return {"anyOf": schema["anyOf"] + [{"type": "null"}]}
+            return {"anyOf": [schema, {"type": "null"}]}
+
+        if origin is Literal:
+            schema: dict[str, Any] = {"enum": list(args)}
+            literal_types = {BASIC_TYPE_MAPPING.get(type(arg)) for arg in args}
+            if len(literal_types) == 1 and None not in literal_types:
+                schema["type"] = literal_types.pop()
+            return schema
+
+        if inspect.isclass(python_type) and issubclass(python_type, Enum):
+            return {"enum": [member.value for member in python_type]}
+
+        if inspect.isclass(python_type) and issubclass(python_type, BaseModel):
+            return python_type.model_json_schema()
 
         # Handle generic types
+        if origin in (list, tuple, set, frozenset):
+            schema = {"type": "array"}
+            item_types = [t for t in args if t is not Ellipsis]
+            if len(set(item_types)) == 1:
+                items = _python_type_to_json_schema(item_types[0])
+                if items:
+                    schema["items"] = items
+            return schema
+
+        if origin is dict:
+            schema = {"type": "object"}
+            if len(args) == 2:
+                values = _python_type_to_json_schema(args[1])
+                if values:
+                    schema["additionalProperties"] = values
+            return schema
+
         if origin is not None:
-            if origin in (list, tuple):
-                return "array"
-            elif origin is dict:
-                return "object"
-            else:
-                python_type = origin
+            python_type = origin
 
-        return BASIC_TYPE_MAPPING.get(python_type, "object")
+        return {"type": BASIC_TYPE_MAPPING.get(python_type, "object")}
 
     except Exception:
-        return "string"
+        return {"type": "string"}
+
+
+def _primary_json_type(schema: dict[str, Any]) -> str:
+    """Summarize a JSON Schema as a single JSON type name"""
+    schema_type = schema.get("type")
+
+    if isinstance(schema_type, str):
+        return schema_type
+    if isinstance(schema_type, list):
+        return next((t for t in schema_type if t != "null"), "null")
+
+    for option in schema.get("anyOf", []):
+        option_type = _primary_json_type(option)
+        if option_type != "null":
+            return option_type
+
+    return "object"
+
+
+def _is_context_parameter(param_name: str, param_type) -> bool:
+    """Check whether a parameter receives the MCP context rather than caller input"""
+    return param_name == "ctx" or param_type is Context
 
 
 def _safe_serialize_default(default_value) -> Any:
@@ -119,141 +200,121 @@ def _safe_serialize_default(default_value) -> Any:
 # DOCSTRING PARSING
 # ============================================================================
 
+# Ordered, so a docstring with several sections of one kind (e.g. Returns and Yields)
+# always parses the same way and manifests stay reproducible
+ARGS_SECTIONS = ("args:", "arguments:", "parameters:")
+RETURNS_SECTIONS = ("returns:", "return:", "yields:", "yield:")
+RAISES_SECTIONS = ("raises:", "raise:")
+EXAMPLES_SECTIONS = ("examples:", "example:")
 
-def _extract_description_from_docstring(docstring: str | None) -> str:
-    """Extract main description from function docstring"""
-    if not docstring:
-        return "No description available"
-
-    lines = docstring.split("\n")
-    description_lines = []
-    found_content = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        if not stripped and not found_content:
-            continue
-
-        # Stop at section headers
-        if _is_section_header(line, DOCSTRING_SECTION_HEADERS, check_indentation=False):
-            break
+# "name: description" or "name (type): description"
+DOCSTRING_ITEM_PATTERN = re.compile(r"^\*{0,2}(\w+)\s*(?:\(([^:]*)\))?\s*:\s*(.*)$")
 
-        if stripped:
-            description_lines.append(stripped)
-            found_content = True
 
-    return " ".join(description_lines) if description_lines else "No description available"
+@dataclass(frozen=True)
+class ParamDoc:
+    """Documentation of a single parameter or raised exception"""
 
+    description: str
+    type: str | None = None
 
-def _is_section_header(
-    line: str, valid_sections: list | None = None, check_indentation: bool = True
-) -> bool:
-    """Check if a line is a docstring section header"""
-    stripped = line.strip()
 
-    if not (stripped and stripped.endswith(":")):
-        return False
+@dataclass(frozen=True)
+class ParsedDocstring:
+    """Structured view of a Google-style docstring"""
 
-    if check_indentation and line.startswith((" ", "\t")):
-        return False
+    description: str
+    args: dict[str, ParamDoc] = field(default_factory=dict)
+    returns: str | None = None
+    raises: dict[str, ParamDoc] = field(default_factory=dict)
+    examples: list[str] = field(default_factory=list)
 
-    if valid_sections is not None:
-        return stripped.lower() in valid_sections
 
-    return True
+def _parse_items(lines: list[str]) -> dict[str, ParamDoc]:
+    """Parse the "name (type): description" entries of an Args or Raises section"""
+    items: dict[str, ParamDoc] = {}
+    item_indent = None
+    current = None
+    parts: list[str] = []
 
+    def flush():
+        if current is not None:
+            name, type_name = current
+            items[name] = ParamDoc(" ".join(parts), type_name)
 
-def _find_section_start(lines: list, section_names: list) -> int | None:
-    """Find the start line index of a docstring section"""
-    for i, line in enumerate(lines):
-        if _is_section_header(line, section_names, check_indentation=False):
-            return i + 1
-    return None
-
-
-def _parse_args_section(docstring: str, param_name: str) -> str | None:
-    """Parse the Args section of a docstring to find parameter descriptions"""
-    lines = docstring.split("\n")
-    args_start = _find_section_start(lines, ["args:", "arguments:", "parameters:"])
-
-    if args_start is None:
-        return None
-
-    for i in range(args_start, len(lines)):
-        line = lines[i]
+    for line in lines:
         stripped = line.strip()
-
-        # Stop at next section
-        if _is_section_header(line):
-            break
-
-        if ":" not in stripped:
+        if not stripped:
             continue
 
-        param_part, desc_part = stripped.split(":", 1)
-        param_part = param_part.strip()
+        indent = len(line) - len(line.lstrip())
+        match = DOCSTRING_ITEM_PATTERN.match(stripped)
 
-        # Match exact parameter name or with type annotation
-        if param_part == param_name or param_part.startswith(f"{param_name} ("):
-            desc_part = desc_part.strip()
-            if desc_part:
-                return _extract_multiline_description(lines, i, desc_part)
+        if match and (item_indent is None or indent <= item_indent):
+            flush()
+            item_indent = indent
+            name, type_name, description = match.groups()
+            current = (name, type_name.strip() if type_name else None)
+            parts = [description.strip()] if description.strip() else []
+        elif current is not None:
+            parts.append(stripped)
 
-    return None
+    flush()
+    return items
 
 
-def _extract_multiline_description(lines: list, start_index: int, first_line: str) -> str:
-    """Extract multiline description starting from a given line"""
-    full_description = [first_line]
-    base_indent = len(lines[start_index]) - len(lines[start_index].lstrip())
+def _split_blocks(lines: list[str]) -> list[str]:
+    """Split section lines into blank-line separated blocks"""
+    blocks: list[str] = []
+    block: list[str] = []
 
-    for j in range(start_index + 1, len(lines)):
-        next_line = lines[j]
+    for line in lines + [""]:
+        if line.strip():
+            block.append(line)
+        elif block:
+            blocks.append(textwrap.dedent("\n".join(block)))
+            block = []
 
-        if not next_line.strip():
-            continue
-
-        next_indent = len(next_line) - len(next_line.lstrip())
-
-        if next_indent > base_indent:
-            full_description.append(next_line.strip())
-        else:
-            break
-
-    return " ".join(full_description)
+    return blocks
 
 
-def _parse_returns_section(docstring: str | None) -> str | None:
-    """Parse the Returns section of a docstring"""
+@lru_cache(maxsize=None)
+def parse_docstring(docstring: str | None) -> ParsedDocstring:
+    """Parse a Google-style docstring in a single pass over its lines"""
     if not docstring:
-        return None
+        return ParsedDocstring(description="No description available")
 
-    lines = docstring.split("\n")
-    returns_start = _find_section_start(lines, ["returns:", "return:"])
+    sections: dict[str, list[str]] = {}
+    description_lines: list[str] = []
+    current: list[str] | None = None
 
-    if returns_start is None:
-        return None
+    for line in inspect.cleandoc(docstring).split("\n"):
+        header = line.strip().lower()
 
-    description_lines: list[str] = []
+        if header in DOCSTRING_SECTION_HEADERS:
+            current = sections.setdefault(header, [])
+        elif current is not None:
+            current.append(line)
+        elif line.strip():
+            description_lines.append(line.strip())
 
-    for i in range(returns_start, len(lines)):
-        line = lines[i]
-        stripped = line.strip()
+    def section(names: tuple[str, ...]) -> list[str]:
+        return [line for name in names if name in sections for line in sections[name]]
 
-        # Stop at next section
-        if _is_section_header(line):
-            break
+    returns = " ".join(line.strip() for line in section(RETURNS_SECTIONS) if line.strip())
 
-        if not stripped and not description_lines:
-            continue
+    return ParsedDocstring(
+        description=" ".join(description_lines) or "No description available",
+        args=_parse_items(section(ARGS_SECTIONS)),
+        returns=returns or None,
+        raises=_parse_items(section(RAISES_SECTIONS)),
+        examples=_split_blocks(section(EXAMPLES_SECTIONS)),
+    )
 
-        if stripped:
-            description_lines.append(stripped)
-        elif description_lines:
-            break
 
-    return " ".join(description_lines) if description_lines else None
+def _format_annotation(python_type) -> str:
+    """Render a type hint as a readable string, e.g. list[dict[str, Any]] | None"""
+    return inspect.formatannotation(python_type).replace("typing.", "")
 
 
 # ============================================================================
@@ -261,42 +322,38 @@ def _parse_returns_section(docstring: str | None) -> str | None:
 # ============================================================================
 
 
-def _extract_param_description(docstring: str | None, param_name: str, param_type) -> str:
-    """Extract parameter description from docstring"""
-    if not docstring:
-        return f"Parameter {param_name}"
-
-    args_description = _parse_args_section(docstring, param_name)
-    return args_description if args_description else f"Parameter {param_name}"
-
-
 def _extract_parameter_info(
     param_name: str,
     param: inspect.Parameter,
     type_hints: dict,
-    docstring: str | None,
+    docstring: ParsedDocstring,
 ) -> dict:
-    """Extract complete parameter information"""
+    """Extract complete parameter information
+
+    The parameter's JSON Schema (including its default) is the single source of its
+    type; compact catalogs summarize it as a primary type instead.
+    """
     try:
         param_type = type_hints.get(param_name, str)
-
-        param_info = {
-            "type": _python_type_to_json_type(param_type),
-            "required": param.default == inspect.Parameter.empty,
-            "description": _extract_param_description(docstring, param_name, param_type),
-        }
+        param_doc = docstring.args.get(param_name)
+        schema = _python_type_to_json_schema(param_type)
 
         if param.default != inspect.Parameter.empty:
-            param_info["default"] = _safe_serialize_default(param.default)
+            schema = {**schema, "default": _safe_serialize_default(param.default)}
 
-        return param_info
+        return {
+            "annotation": _format_annotation(param_type),
+            "required": param.default == inspect.Parameter.empty,
+            "description": param_doc.description if param_doc else f"Parameter {param_name}",
+            "schema": schema,
+        }
 
     except Exception as e:
         logger.warning(f"Could not extract metadata for parameter {param_name}: {e}")
         return {
-            "type": "string",
             "required": param.default == inspect.Parameter.empty,
             "description": f"Parameter {param_name}",
+            "schema": {"type": "string"},
         }
 
 
@@ -310,24 +367,28 @@ def extract_function_metadata(func) -> dict[str, Any]:
     try:
         signature = inspect.signature(func)
         type_hints = _get_type_hints_safely(func)
-        description = _extract_description_from_docstring(func.__doc__)
+        docstring = parse_docstring(func.__doc__)
 
         parameters = {}
         for param_name, param in signature.parameters.items():
+            if _is_context_parameter(param_name, type_hints.get(param_name)):
+                continue
             parameters[param_name] = _extract_parameter_info(
-                param_name, param, type_hints, func.__doc__
+                param_name, param, type_hints, docstring
             )
 
         result = {
             "implementation": func,
-            "description": description,
+            "description": docstring.description,
             "parameters": parameters,
+            "input_schema": _build_input_schema(parameters),
         }
 
         # Add returns info if available
-        returns_description = _parse_returns_section(func.__doc__)
-        if returns_description:
-            result["returns"] = {"description": returns_description, "type": "object"}
+        if docstring.returns:
+            result["returns"] = {"description": docstring.returns, "type": "object"}
+            if "return" in type_hints:
+                result["returns"]["annotation"] = _format_annotation(type_hints["return"])
 
         return result
 
@@ -336,6 +397,19 @@ def extract_function_metadata(func) -> dict[str, Any]:
         return _create_fallback_metadata(func, str(e))
 
 
+def _build_input_schema(parameters: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Combine parameter schemas into the JSON Schema of a function's keyword arguments"""
+    return {
+        "type": "object",
+        "properties": {
+            name: {**info["schema"], "description": info["description"]}
+            for name, info in parameters.items()
+        },
+        "required": [name for name, info in parameters.items() if info["required"]],
+        "additionalProperties": False,
+    }
+
+
 def _get_type_hints_safely(func) -> dict:
     """Safely get type hints from a function"""
     try:
@@ -359,6 +433,45 @@ def _create_fallback_metadata(func, error: str) -> dict:
 # REGISTRY BUILDING
 # ============================================================================
 
+# Bump when the manifest layout or the extracted metadata changes
+MANIFEST_FORMAT_VERSION = 4
+
+REGISTRY_MANIFEST_PATH = Path(
+    os.getenv(
+        "BRAZE_REGISTRY_MANIFEST",
+        str(Path.home() / ".cache" / "braze-mcp-write" / "registry_manifest.json"),
+    )
+)
+
+
+class LazyImplementation:
+    """Registry implementation that imports its tool module on first call"""
+
+    __slots__ = ("module_name", "function_name", "_function")
+
+    def __init__(self, module_name: str, function_name: str):
+        self.module_name = module_name
+        self.function_name = function_name
+        self._function = None
+
+    @property
+    def __name__(self) -> str:
+        return self.function_name
+
+    def resolve(self):
+        """Import the tool module if needed and return the actual function"""
+        if self._function is None:
+            module = importlib.import_module(self.module_name)
+            self._function = getattr(module, self.function_name)
+            logger.debug(f"Loaded {self.function_name} from {self.module_name}")
+        return self._function
+
+    async def __call__(self, *args, **kwargs):
+        return await self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyImplementation {self.module_name}.{self.function_name}>"
+
 
 def _is_valid_function(obj, name: str) -> bool:
     """Check if an object is a valid function for the registry"""
@@ -370,51 +483,273 @@ def _is_valid_function(obj, name: str) -> bool:
     )
 
 
-def _discover_mcp_tool_modules():
-    """Discover all modules in the tools package that have __register_mcp_tools__ = True"""
-    discovered_modules = []
+def _discover_tool_module_names() -> list[str]:
+    """List the modules in the tools package without importing them"""
+    return sorted(
+        module_info.name
+        for module_info in pkgutil.iter_modules(
+            braze_mcp_write.tools.__path__, braze_mcp_write.tools.__name__ + "."
+        )
+    )
+
+
+def _file_hash(path: str | os.PathLike) -> str | None:
+    """Return the SHA-256 of a file's contents"""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _module_source_hash(module_name: str) -> str | None:
+    """Return the SHA-256 of a tool module's source file, without importing it"""
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    return _file_hash(spec.origin) if spec and spec.origin else None
+
+
+def _manifest_header() -> dict[str, Any]:
+    """Identify the builder that produced a manifest; a change invalidates every module"""
+    return {
+        "format": MANIFEST_FORMAT_VERSION,
+        "builder": _file_hash(__file__),
+    }
+
+
+def _build_module_entry(module_name: str) -> dict[str, Any]:
+    """Import a tool module and extract the metadata of its functions"""
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        logger.warning(f"Failed to import module {module_name}: {e}")
+        return {"register": False, "functions": {}}
 
-    for module_info in pkgutil.iter_modules(
-        braze_mcp_write.tools.__path__, braze_mcp_write.tools.__name__ + "."
-    ):
-        try:
-            module = importlib.import_module(module_info.name)
+    if not getattr(module, "__register_mcp_tools__", False):
+        return {"register": False, "functions": {}}
 
-            if hasattr(module, "__register_mcp_tools__") and module.__register_mcp_tools__:
-                discovered_modules.append(module)
-                logger.info(f"Discovered MCP tools module: {module_info.name}")
+    logger.info(f"Discovered MCP tools module: {module_name}")
+    functions = {}
+
+    for name, obj in inspect.getmembers(module):
+        if _is_valid_function(obj, name):
+            try:
+                metadata = extract_function_metadata(obj)
+                metadata.pop("implementation", None)
+                functions[name] = metadata
+            except Exception:
+                logger.exception(f"Failed to register function {name}")
+                # Don't raise - continue with other functions
+
+    return {
+        "register": True,
+        "access": getattr(module, "__mcp_tool_access__", "write"),
+        "functions": functions,
+    }
 
-        except Exception as e:
-            logger.warning(f"Failed to import module {module_info.name}: {e}")
 
-    return discovered_modules
+def build_registry_manifest(
+    previous: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], list[str]]:
+    """Build a JSON-serializable registry manifest
+
+    Modules whose source hash matches their entry in the previous manifest are
+    reused as-is; only new or changed modules are imported and parsed.
+
+    Returns:
+        Tuple of (manifest, names of the modules that were rebuilt)
+    """
+    header = _manifest_header()
+    reusable = {}
+    if previous and {k: previous.get(k) for k in header} == header:
+        reusable = previous.get("modules", {})
+
+    modules = {}
+    rebuilt = []
+
+    for module_name in _discover_tool_module_names():
+        source = _module_source_hash(module_name)
+        entry = reusable.get(module_name)
+
+        if source is None or entry is None or entry.get("source") != source:
+            entry = {**_build_module_entry(module_name), "source": source}
+            rebuilt.append(module_name)
+
+        modules[module_name] = entry
+
+    return {**header, "modules": modules}, rebuilt
+
+
+def load_registry_manifest(path: Path = REGISTRY_MANIFEST_PATH) -> dict[str, Any] | None:
+    """Load a persisted manifest, returning None if it is missing or unreadable"""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable registry manifest {path}: {e}")
+        return None
+
+
+def save_registry_manifest(manifest: dict[str, Any], path: Path = REGISTRY_MANIFEST_PATH) -> None:
+    """Persist a manifest atomically; failures are logged and otherwise ignored"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+        logger.info(f"Saved registry manifest to {path}")
+    except OSError as e:
+        logger.warning(f"Could not save registry manifest to {path}: {e}")
+
+
+def update_registry_manifest(
+    path: Path = REGISTRY_MANIFEST_PATH, force: bool = False
+) -> tuple[dict[str, Any], list[str]]:
+    """Bring the persisted manifest up to date with the tool sources
+
+    Args:
+        path: Manifest file location
+        force: If True, re-parse every module instead of reusing unchanged entries
+
+    Returns:
+        Tuple of (manifest, names of the modules that were rebuilt)
+    """
+    previous = None if force else load_registry_manifest(path)
+    manifest, rebuilt = build_registry_manifest(previous)
+
+    if manifest != previous:
+        if rebuilt:
+            logger.info(f"Rebuilt registry metadata for: {', '.join(rebuilt)}")
+        save_registry_manifest(manifest, path)
+
+    return manifest, rebuilt
 
 
 def build_function_registry() -> dict[str, dict[str, Any]]:
-    """Automatically discover and register functions from tools modules"""
+    """Build the function registry from the manifest, importing tool modules lazily
+
+    Tool modules are only imported (and their docstrings parsed) when their source
+    changed since the manifest was built. Otherwise each implementation imports its
+    module the first time it is called.
+    """
+    manifest, _ = update_registry_manifest()
     registry = {}
-    modules = _discover_mcp_tool_modules()
 
-    for module in modules:
-        module_name = module.__name__.split(".")[-1]
+    for module_name, entry in manifest["modules"].items():
+        if not entry["register"]:
+            continue
 
-        for name, obj in inspect.getmembers(module):
-            if _is_valid_function(obj, name):
-                try:
-                    registry[name] = extract_function_metadata(obj)
-                    logger.info(f"Registered function: {name} from {module_name}")
-                except Exception:
-                    logger.exception(f"Failed to register function {name}")
-                    # Don't raise - continue with other functions
+        for name, metadata in entry["functions"].items():
+            registry[name] = {
+                **metadata,
+                "implementation": LazyImplementation(module_name, name),
+                "module": module_name.split(".")[-1],
+                "access": entry["access"],
+            }
+            logger.debug(f"Registered function: {name} from {module_name}")
 
+    logger.info(f"Registered {len(registry)} functions")
     return registry
 
 
+@lru_cache(maxsize=None)
 def get_function_registry() -> dict[str, dict[str, Any]]:
-    """Get the function registry, building it if needed"""
+    """Get the function registry, building it on first use"""
     return build_function_registry()
 
 
-# For compatibility, expose the registry
-FUNCTION_REGISTRY = get_function_registry()
+# ============================================================================
+# FUNCTION CATALOG
+# ============================================================================
+
+
+def build_function_catalog(registry: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Build the JSON-serializable function catalog served by list_functions"""
+    return {
+        name: {
+            "description": info["description"],
+            "parameters": info["parameters"],
+            "returns": info.get("returns", {}),
+            "module": info.get("module"),
+            "access": info.get("access", "write"),
+        }
+        for name, info in registry.items()
+    }
+
+
+def _compact_parameter_info(param: dict[str, Any]) -> dict[str, Any]:
+    """Summarize a parameter as its primary JSON type, requiredness and default"""
+    schema = param["schema"]
+    compact = {"type": _primary_json_type(schema), "required": param["required"]}
+    if "default" in schema:
+        compact["default"] = schema["default"]
+    return compact
+
+
+def _compact_function_info(info: dict[str, Any]) -> dict[str, Any]:
+    """Strip descriptions, annotations and full schemas from a catalog entry"""
+    return {
+        **info,
+        "parameters": {
+            name: _compact_parameter_info(param) for name, param in info["parameters"].items()
+        },
+        "returns": {
+            k: v for k, v in info["returns"].items() if k not in ("description", "annotation")
+        },
+    }
+
+
+@lru_cache(maxsize=None)
+def get_function_catalog() -> dict[str, dict[str, Any]]:
+    """Get the function catalog, building it (and the registry) on first use"""
+    return build_function_catalog(get_function_registry())
+
+
+def __getattr__(name: str) -> Any:
+    # FUNCTION_REGISTRY and FUNCTION_CATALOG are built on first access rather than at
+    # import, so importing the manifest helpers (e.g. for build-manifest) does not
+    # import every tool module or write the default manifest
+    if name == "FUNCTION_REGISTRY":
+        return get_function_registry()
+    if name == "FUNCTION_CATALOG":
+        return get_function_catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=128)
+def render_function_catalog(
+    module: str | None = None,
+    access: str | None = None,
+    name_prefix: str | None = None,
+    compact: bool = False,
+) -> tuple[str, str]:
+    """Serialize a filtered view of the function catalog, once per filter combination
+
+    Returns:
+        Tuple of (version, payload) where version is a content hash of the view and
+        payload is the serialized list_functions response
+    """
+    functions = {
+        name: _compact_function_info(info) if compact else info
+        for name, info in get_function_catalog().items()
+        if (module is None or info["module"] == module)
+        and (access is None or info["access"] == access)
+        and (name_prefix is None or name.startswith(name_prefix))
+    }
+
+    version = hashlib.sha256(
+        json.dumps(functions, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+    payload = json.dumps(
+        {
+            "available_functions": functions,
+            "total_functions": len(functions),
+            "version": version,
+        },
+        separators=(",", ":"),
+    )
+    return version, payload
 
@@ -15,9 +15,22 @@ from braze_mcp_write.models.errors import (
     function_not_found_error,
     internal_error,
     invalid_params_error,
+    model_not_found_error,
 )
-from braze_mcp_write.registry_builder import FUNCTION_REGISTRY
+from braze_mcp_write.models.schemas import (
+    available_models,
+    describe_model_schema,
+    schema_reference,
+)
+from braze_mcp_write.registry_builder import FUNCTION_REGISTRY, render_function_catalog
+from braze_mcp_write.utils.batching import gather_bounded
 from braze_mcp_write.utils.context import braze_lifespan
+from braze_mcp_write.utils.idempotency import (
+    IdempotencyConflictError,
+    canonical_fingerprint,
+    idempotency_cache,
+)
+from braze_mcp_write.utils.validation import validate_json_schema
 
 # Initialize FastMCP server
 mcp = FastMCP(
@@ -30,29 +43,69 @@ AVAILABLE_FUNCTION_NAMES = list(FUNCTION_REGISTRY.keys())
 
 
 @mcp.tool()
-async def list_functions() -> dict[str, Any]:
+async def list_functions(
+    module: str | None = None,
+    access: str | None = None,
+    name_prefix: str | None = None,
+    compact: bool = False,
+    if_none_match: str | None = None,
+) -> str:
     """Lists all available Braze API functions with their descriptions and parameters.
 
+    The catalog is precomputed once per filter combination. Every response carries a
+    version hash; pass it back as if_none_match to skip re-fetching an unchanged catalog.
+
+    Args:
+        module: Only list functions from this tools module (e.g. users_write)
+        access: Only list "read" or "write" functions
+        name_prefix: Only list functions whose name starts with this prefix
+        compact: If True, omit parameter and return descriptions to shrink the payload
+        if_none_match: Version hash from a previous list_functions response
+
     Returns:
-        Dictionary containing all available functions and their metadata
+        JSON object containing the matching functions, their metadata and the catalog version,
+        or a not_modified marker when if_none_match matches the current version
     """
     try:
-        available_functions = {}
+        version, payload = render_function_catalog(module, access, name_prefix, compact)
 
-        for func_name, func_info in FUNCTION_REGISTRY.items():
-            available_functions[func_name] = {
-                "description": func_info["description"],
-                "parameters": func_info["parameters"],
-                "returns": func_info.get("returns", {}),
-            }
+        if if_none_match == version:
+            return json.dumps({"not_modified": True, "version": version})
+
+        return payload
+
+    except Exception:
+        return json.dumps(internal_error("Error listing functions", "list_functions"))
+
+
+@mcp.tool()
+async def describe_model(model_name: str, if_none_match: str | None = None) -> str:
+    """Get the JSON schema of a response model referenced by call_function results.
+
+    Results that are structured models carry schema.model_name and schema.version instead of
+    the full schema. Schemas are generated once per model; pass a known version as
+    if_none_match to skip re-fetching an unchanged schema.
+
+    Args:
+        model_name: Model name from a result's schema.model_name (a bare class name also works if unambiguous)
+        if_none_match: Schema version from a previous describe_model response or result
 
-        return {
-            "available_functions": available_functions,
-            "total_functions": len(available_functions),
-        }
+    Returns:
+        JSON object with the model name, schema version and JSON schema fields, or a
+        not_modified marker when if_none_match matches the current version
+    """
+    try:
+        description = describe_model_schema(model_name)
+        if description is None:
+            return json.dumps(model_not_found_error(model_name, available_models()))
+
+        if if_none_match == description["version"]:
+            return json.dumps({"not_modified": True, "version": description["version"]})
+
+        return json.dumps(description, separators=(",", ":"))
 
     except Exception:
-        return internal_error("Error listing functions", "list_functions")
+        return json.dumps(internal_error("Error describing model", "describe_model"))
 
 
 @mcp.tool()
@@ -60,17 +113,119 @@ async def call_function(
     ctx: Context,
     function_name: str,
     parameters: dict[str, Any] | str | None = None,
+    idempotency_key: str | None = None,
 ) -> Any:
     """Call a specific Braze API function with the provided parameters.
 
+    Write calls given an idempotency_key are deduplicated: repeating the call with the same key
+    within BRAZE_IDEMPOTENCY_TTL seconds returns the stored result, marked with idempotent_replay,
+    instead of calling Braze again. Calls without a key always run.
+
     Args:
         ctx: The MCP context
         function_name: Name of the function to call (use list_functions to see available options)
         parameters: Dictionary of parameters to pass to the function, or JSON string that will be parsed to dictionary (optional)
+        idempotency_key: Key identifying this write; reuse it when retrying the same call (optional; without it the call is never deduplicated)
 
     Returns:
         The function result as a dictionary or error dictionary
     """
+    return await _execute_function(ctx, function_name, parameters, idempotency_key=idempotency_key)
+
+
+@mcp.tool()
+async def call_functions_batch(
+    ctx: Context,
+    calls: list[dict[str, Any]] | str,
+    max_concurrency: int | None = None,
+    stop_on_error: bool = False,
+) -> dict[str, Any]:
+    """Call many Braze API functions in a single request.
+
+    Calls run concurrently over the shared HTTP client and results are returned in the
+    same order as the calls.
+
+    Args:
+        ctx: The MCP context
+        calls: List of {"function_name": ..., "parameters": {...}, "idempotency_key": ...} objects (idempotency_key is optional), or JSON string that will be parsed to a list
+        max_concurrency: Maximum number of calls running at once (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
+        stop_on_error: If True, calls not yet started when one fails are skipped; calls already running complete. If False, every call runs (best effort)
+
+    Returns:
+        Dictionary with per-call results in order and succeeded/failed/skipped counts
+    """
+    operation = "call_functions_batch"
+
+    if isinstance(calls, str):
+        try:
+            calls = json.loads(calls)
+        except json.JSONDecodeError:
+            return invalid_params_error("Invalid JSON in calls string", operation)
+
+    if not isinstance(calls, list):
+        return invalid_params_error(
+            f"calls must be a list or JSON string, got {type(calls).__name__}", operation
+        )
+
+    stopped = False
+
+    async def run(entry: Any) -> dict[str, Any]:
+        nonlocal stopped
+
+        if stopped:
+            return {"status": "skipped"}
+
+        if not isinstance(entry, dict) or not isinstance(entry.get("function_name"), str):
+            result = invalid_params_error(
+                "Each call must be an object with a function_name string", operation
+            )
+        else:
+            result = await _execute_function(
+                ctx,
+                entry["function_name"],
+                entry.get("parameters"),
+                operation,
+                entry.get("idempotency_key"),
+            )
+
+        status = "error" if isinstance(result, dict) and "error" in result else "ok"
+
+        if status == "error" and stop_on_error:
+            stopped = True
+
+        return {"status": status, "result": result}
+
+    outcomes = await gather_bounded(
+        [lambda entry=entry: run(entry) for entry in calls], max_concurrency
+    )
+
+    results = []
+    for index, (entry, outcome) in enumerate(zip(calls, outcomes)):
+        if isinstance(outcome, BaseException):
+            outcome = {
+                "status": "error",
+                "result": internal_error("Error running batch call", operation),
+            }
+        function_name = entry.get("function_name") if isinstance(entry, dict) else None
+        results.append({"index": index, "function_name": function_name, **outcome})
+
+    return {
+        "results": results,
+        "total": len(results),
+        "succeeded": sum(1 for r in results if r["status"] == "ok"),
+        "failed": sum(1 for r in results if r["status"] == "error"),
+        "skipped": sum(1 for r in results if r["status"] == "skipped"),
+    }
+
+
+async def _execute_function(
+    ctx: Context,
+    function_name: str,
+    parameters: dict[str, Any] | str | None = None,
+    operation: str = "call_function",
+    idempotency_key: str | None = None,
+) -> Any:
+    """Parse, validate and run one registered function, returning its result or an error"""
     try:
         if function_name not in FUNCTION_REGISTRY:
             return function_not_found_error(function_name, AVAILABLE_FUNCTION_NAMES)
@@ -88,36 +243,67 @@ async def call_function(
                     if not isinstance(parsed_parameters, dict):
                         return invalid_params_error(
                             "Parameters string must parse to a JSON object/dictionary",
-                            "call_function",
+                            operation,
                         )
                 except json.JSONDecodeError:
                     return invalid_params_error(
-                        "Invalid JSON in parameters string", "call_function"
+                        "Invalid JSON in parameters string", operation
                     )
             elif isinstance(parameters, dict):
                 parsed_parameters = parameters
             else:
                 return invalid_params_error(
                     f"Parameters must be a dictionary or JSON string, got {type(parameters).__name__}",
-                    "call_function",
+                    operation,
                 )
 
-        # Call the function with context as first parameter
-        result = await implementation(ctx, **parsed_parameters)
-
-        # Convert Pydantic models to dictionaries for MCP transport with schema context
-        if isinstance(result, BaseModel):
-            return {
-                "data": result.model_dump(),
-                "schema": {
-                    "model_name": result.__class__.__name__,
-                    "fields": result.model_json_schema(),
-                    "description": f"Response data structured according to the {result.__class__.__name__} model",
-                },
-            }
+        # Reject malformed parameters locally, before any request reaches Braze
+        input_schema = func_info.get("input_schema")
+        if input_schema:
+            errors = validate_json_schema(parsed_parameters, input_schema, path="parameters")
+            if errors:
+                return invalid_params_error(
+                    f"Invalid parameters for '{function_name}': {'; '.join(errors)}", operation
+                )
+
+        async def invoke() -> Any:
+            # Call the function with context as first parameter
+            result = await implementation(ctx, **parsed_parameters)
+
+            # Convert Pydantic models to dictionaries for MCP transport; the schema is
+            # referenced by name and version and served separately by describe_model
+            if isinstance(result, BaseModel):
+                return {
+                    "data": result.model_dump(),
+                    "schema": schema_reference(type(result)),
+                }
+
+            return result
+
+        # Only deduplicate writes the caller marked as retries of one another: identical
+        # parameters can still be separate events, or name a file whose contents changed
+        if (
+            idempotency_key is None
+            or func_info.get("access", "write") != "write"
+            or not idempotency_cache.enabled
+        ):
+            return await invoke()
+
+        fingerprint = canonical_fingerprint(function_name, parsed_parameters)
+        try:
+            result, replayed = await idempotency_cache.run(
+                idempotency_key,
+                fingerprint,
+                invoke,
+                lambda result: not (isinstance(result, dict) and "error" in result),
+            )
+        except IdempotencyConflictError as e:
+            return invalid_params_error(str(e), operation)
 
+        if replayed and isinstance(result, dict):
+            return {**result, "idempotent_replay": True}
         return result
 
     except Exception:
-        return internal_error(f"Error calling function '{function_name}'", "call_function")
+        return internal_error(f"Error calling function '{function_name}'", operation)
 
@@ -8,7 +8,14 @@ from typing import Any
 
 from mcp.server.fastmcp import Context
 
-from braze_mcp_write.utils import get_braze_context, get_logger, handle_response, make_request
+from braze_mcp_write.utils import (
+    get_braze_context,
+    get_logger,
+    handle_response,
+    make_request,
+    send_recipient_shards,
+    send_trigger_request,
+)
 
 __register_mcp_tools__ = True
 
@@ -45,7 +52,7 @@ async def send_campaign(
         dry_run: If True, validates but doesn't send
 
     Returns:
-        Dictionary with send confirmation and dispatch_id
+        Dictionary with send confirmation and dispatch_id. Recipient lists over 50 are sent in concurrent shards and the response lists every dispatch_id, with errors per shard
     """
     url_path = "campaigns/trigger/send"
 
@@ -71,11 +78,15 @@ async def send_campaign(
 
     bctx = get_braze_context(ctx)
 
-    response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
-    )
+    if not recipients:
+        return await send_trigger_request(bctx, url_path, body, "send campaign")
 
-    return handle_response(response, dict, "send campaign", logger)
+    return await send_recipient_shards(
+        lambda shard: send_trigger_request(
+            bctx, url_path, {**body, "recipients": shard}, "send campaign"
+        ),
+        recipients,
+    )
 
 
 async def schedule_campaign(
@@ -158,7 +169,7 @@ async def update_campaign_schedule(
     bctx = get_braze_context(ctx)
 
     response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
+        bctx.http_client, bctx.base_url, url_path, body=body, method="POST", idempotent=True
     )
 
     return handle_response(response, dict, "update campaign schedule", logger)
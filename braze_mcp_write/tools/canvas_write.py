@@ -8,7 +8,14 @@ from typing import Any
 
 from mcp.server.fastmcp import Context
 
-from braze_mcp_write.utils import get_braze_context, get_logger, handle_response, make_request
+from braze_mcp_write.utils import (
+    get_braze_context,
+    get_logger,
+    handle_response,
+    make_request,
+    send_recipient_shards,
+    send_trigger_request,
+)
 
 __register_mcp_tools__ = True
 
@@ -43,7 +50,7 @@ async def trigger_canvas(
         dry_run: If True, validates but doesn't trigger
 
     Returns:
-        Dictionary with trigger confirmation and dispatch_id
+        Dictionary with trigger confirmation and dispatch_id. Recipient lists over 50 are sent in concurrent shards and the response lists every dispatch_id, with errors per shard
     """
     url_path = "canvas/trigger/send"
 
@@ -65,11 +72,15 @@ async def trigger_canvas(
 
     bctx = get_braze_context(ctx)
 
-    response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
-    )
+    if not recipients:
+        return await send_trigger_request(bctx, url_path, body, "trigger canvas")
 
-    return handle_response(response, dict, "trigger canvas", logger)
+    return await send_recipient_shards(
+        lambda shard: send_trigger_request(
+            bctx, url_path, {**body, "recipients": shard}, "trigger canvas"
+        ),
+        recipients,
+    )
 
 
 async def schedule_canvas(
@@ -147,7 +158,7 @@ async def update_canvas_schedule(
     bctx = get_braze_context(ctx)
 
     response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
+        bctx.http_client, bctx.base_url, url_path, body=body, method="POST", idempotent=True
     )
 
     return handle_response(response, dict, "update canvas schedule", logger)
@@ -1,19 +1,52 @@
 """
 Catalog management write operations for Braze MCP server.
 
-This module provides functions for creating, updating, and deleting catalog items.
+This module provides functions for creating, updating, and deleting catalog items,
+and for syncing a catalog to a desired-state file.
 """
 
+import hashlib
+import json
+import os
+from pathlib import Path
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
-from braze_mcp_write.utils import get_braze_context, get_logger, handle_response, make_request
+from braze_mcp_write.utils import (
+    CATALOG_ITEMS_BATCH_SIZE,
+    BrazeContext,
+    chunked,
+    decode_json,
+    describe_exception,
+    gather_bounded,
+    get_braze_context,
+    get_logger,
+    handle_response,
+    make_request,
+    rate_limiter,
+)
+from braze_mcp_write.utils.safety import MAX_CATALOG_UPDATES_PER_MIN
 
 __register_mcp_tools__ = True
 
 logger = get_logger(__name__)
 
+# Where catalog sync keeps the content hashes of the items it last pushed
+CATALOG_SNAPSHOT_DIR = Path(
+    os.getenv(
+        "BRAZE_CATALOG_SNAPSHOT_DIR",
+        str(Path.home() / ".cache" / "braze-mcp-write" / "catalog_snapshots"),
+    )
+)
+
+CATALOG_ITEM_OPERATIONS = {"POST": "create", "PUT": "update", "DELETE": "delete"}
+
+SYNC_COUNT_KEYS = {"create": "created", "update": "updated", "delete": "deleted"}
+
+# Number of item ids per operation listed in a dry run sync plan
+SYNC_PREVIEW_SIZE = 20
+
 
 # ============================================================================
 # CATALOG ITEM OPERATIONS
@@ -35,19 +68,11 @@ async def create_catalog_items(
         dry_run: If True, validates but doesn't create
 
     Returns:
-        Dictionary with creation confirmation
+        Dictionary with creation confirmation. Lists over 50 items are sent in chunks, and failed items are listed in failed_items by id
     """
-    url_path = f"catalogs/{catalog_name}/items"
-
-    body = {"items": items}
-
     bctx = get_braze_context(ctx)
 
-    response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
-    )
-
-    return handle_response(response, dict, "create catalog items", logger)
+    return await _send_catalog_items(bctx, catalog_name, "POST", items)
 
 
 async def update_catalog_items(
@@ -65,19 +90,11 @@ async def update_catalog_items(
         dry_run: If True, validates but doesn't update
 
     Returns:
-        Dictionary with update confirmation
+        Dictionary with update confirmation. Lists over 50 items are sent in chunks, and failed items are listed in failed_items by id
     """
-    url_path = f"catalogs/{catalog_name}/items"
-
-    body = {"items": items}
-
     bctx = get_braze_context(ctx)
 
-    response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="PUT"
-    )
-
-    return handle_response(response, dict, "update catalog items", logger)
+    return await _send_catalog_items(bctx, catalog_name, "PUT", items)
 
 
 async def delete_catalog_items(
@@ -97,7 +114,7 @@ async def delete_catalog_items(
         confirm: Must be True to execute this destructive operation
 
     Returns:
-        Dictionary with deletion confirmation
+        Dictionary with deletion confirmation. Lists over 50 items are sent in chunks, and failed items are listed in failed_items by id
     """
     if not confirm and not dry_run:
         return {
@@ -105,17 +122,312 @@ async def delete_catalog_items(
             "message": "Set confirm=True to delete catalog items",
         }
 
-    url_path = f"catalogs/{catalog_name}/items"
+    bctx = get_braze_context(ctx)
+
+    return await _send_catalog_items(
+        bctx, catalog_name, "DELETE", [{"id": item_id} for item_id in item_ids]
+    )
 
-    body = {"items": [{"id": item_id} for item_id in item_ids]}
 
-    bctx = get_braze_context(ctx)
+async def _send_catalog_items(
+    bctx: BrazeContext, catalog_name: str, method: str, items: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Send catalog items in API-sized chunks and merge the per-chunk results."""
+    if len(items) <= CATALOG_ITEMS_BATCH_SIZE:
+        return await _send_catalog_items_chunk(bctx, catalog_name, method, items)
+
+    chunks = [chunk for _, chunk in chunked(items, CATALOG_ITEMS_BATCH_SIZE)]
+    logger.info(f"Splitting catalog item request into {len(chunks)} chunks")
+
+    results = await gather_bounded(
+        [
+            lambda chunk=chunk: _send_catalog_items_chunk(bctx, catalog_name, method, chunk)
+            for chunk in chunks
+        ]
+    )
+
+    return _merge_catalog_results(chunks, results)
+
+
+async def _send_catalog_items_chunk(
+    bctx: BrazeContext, catalog_name: str, method: str, items: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Send one catalog item request, paced by BRAZE_MAX_CATALOG_UPDATES_PER_MIN."""
+    await rate_limiter.acquire("catalog_item_updates", MAX_CATALOG_UPDATES_PER_MIN, 60)
 
     response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="DELETE"
+        bctx.http_client,
+        bctx.base_url,
+        f"catalogs/{catalog_name}/items",
+        body={"items": items},
+        method=method,
+    )
+
+    return handle_response(
+        response, dict, f"{CATALOG_ITEM_OPERATIONS[method]} catalog items", logger
+    )
+
+
+def _merge_catalog_results(
+    chunks: list[list[dict[str, Any]]], results: list[dict[str, Any] | BaseException]
+) -> dict[str, Any]:
+    """Merge per-chunk catalog item results into a single response.
+
+    Braze accepts or rejects each catalog item request as a whole, so every item of a
+    failed chunk is reported in failed_items under its id, together with the Braze
+    errors that name it (or all of the chunk's errors when none do). A chunk answered
+    with an error dict (an undecodable or truncated response) counts as failed too.
+    """
+    merged: dict[str, Any] = {
+        "message": "success",
+        "items_processed": 0,
+        "chunks": len(chunks),
+        "chunks_failed": 0,
+        "failed_items": {},
+    }
+
+    for i, (chunk, result) in enumerate(zip(chunks, results)):
+        if isinstance(result, BaseException):
+            error = {**describe_exception(result), "chunk": i}
+            braze_errors = _braze_errors(result)
+        elif "error" in result:
+            error = {"type": result["error"], "message": result.get("message", ""), "chunk": i}
+            braze_errors = []
+        else:
+            merged["items_processed"] += len(chunk)
+            continue
+
+        merged["chunks_failed"] += 1
+
+        for item in chunk:
+            item_id = str(item["id"])
+            item_errors = [
+                braze_error
+                for braze_error in braze_errors
+                if item_id in map(str, braze_error.get("parameter_values") or [])
+            ]
+            merged["failed_items"][item_id] = {
+                **error,
+                "errors": item_errors or braze_errors,
+            }
+
+    if merged["chunks_failed"] == len(chunks):
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise failures[0]
+        merged["message"] = "failed"
+    elif merged["chunks_failed"]:
+        merged["message"] = "partial_success"
+
+    return merged
+
+
+def _braze_errors(exc: BaseException) -> list[dict[str, Any]]:
+    """Extract the errors list from a Braze error response, if the request got one."""
+    response = getattr(exc, "response", None)
+    if response is None:
+        return []
+    try:
+        errors = decode_json(response.content).get("errors")
+    except (ValueError, AttributeError):
+        return []
+    return [error for error in errors if isinstance(error, dict)] if isinstance(errors, list) else []
+
+
+# ============================================================================
+# CATALOG SYNC
+# ============================================================================
+
+
+async def sync_catalog_items(
+    ctx: Context,
+    catalog_name: str,
+    path: str,
+    delete_missing: bool = True,
+    snapshot_path: str | None = None,
+    max_concurrency: int | None = None,
+    dry_run: bool = False,
+    confirm: bool = False,
+) -> dict[str, Any]:
+    """Sync a catalog to a desired-state file, sending only the items that changed.
+
+    Each item is compared with a local snapshot of the content hashes last pushed for the
+    catalog. Only new items are created, changed items updated and (optionally) items missing
+    from the file deleted, in chunks of 50 paced by BRAZE_MAX_CATALOG_UPDATES_PER_MIN. The
+    snapshot is updated for successful chunks only, so failed items are retried on the next sync.
+    Without a snapshot, every item is sent as an update, which creates missing items.
+
+    Args:
+        ctx: The MCP context
+        catalog_name: Name of the catalog
+        path: Path to a .json file (a list of items, or an object with an items list) or a .ndjson/.jsonl file with one item per line. Each item must have an id field
+        delete_missing: If True, deletes previously synced items that are no longer in the file
+        snapshot_path: Snapshot file location (defaults to a per-workspace file in BRAZE_CATALOG_SNAPSHOT_DIR)
+        max_concurrency: Maximum number of chunk requests in flight (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
+        dry_run: If True, computes the sync plan but doesn't send anything
+        confirm: Must be True to execute a sync that deletes items
+
+    Returns:
+        Dictionary with created, updated, deleted and unchanged counts, failed chunks and their item ids
+    """
+    bctx = get_braze_context(ctx)
+
+    file_path = Path(path).expanduser()
+    if not file_path.is_file():
+        raise ValueError(f"File not found: {file_path}")
+
+    snapshot_file = (
+        Path(snapshot_path).expanduser()
+        if snapshot_path
+        else _catalog_snapshot_path(bctx.base_url, catalog_name)
+    )
+    snapshot = _load_catalog_snapshot(snapshot_file)
+    has_snapshot = bool(snapshot)
+
+    plan: dict[str, list[dict[str, Any]]] = {"create": [], "update": [], "delete": []}
+    desired_hashes: dict[str, str] = {}
+    for item in _read_catalog_items(file_path):
+        item_id = str(item["id"])
+        if item_id in desired_hashes:
+            raise ValueError(f"Duplicate item id in {file_path}: {item_id}")
+
+        desired_hashes[item_id] = _item_hash(item)
+        if item_id not in snapshot and has_snapshot:
+            plan["create"].append(item)
+        elif snapshot.get(item_id) != desired_hashes[item_id]:
+            plan["update"].append(item)
+
+    if delete_missing:
+        plan["delete"] = [{"id": item_id} for item_id in snapshot if item_id not in desired_hashes]
+
+    result: dict[str, Any] = {
+        "message": "success",
+        "catalog": catalog_name,
+        "dry_run": dry_run,
+        "created": len(plan["create"]),
+        "updated": len(plan["update"]),
+        "deleted": len(plan["delete"]),
+        "unchanged": len(desired_hashes) - len(plan["create"]) - len(plan["update"]),
+        "snapshot": str(snapshot_file),
+    }
+
+    if dry_run:
+        result["preview"] = {
+            operation: [item["id"] for item in items[:SYNC_PREVIEW_SIZE]]
+            for operation, items in plan.items()
+        }
+        return result
+
+    if plan["delete"] and not confirm:
+        return {
+            "error": "Confirmation required",
+            "message": f"Set confirm=True to sync catalog items. This will delete {len(plan['delete'])} items.",
+        }
+
+    chunks = [
+        (method, chunk)
+        for method, operation in CATALOG_ITEM_OPERATIONS.items()
+        for _, chunk in chunked(plan[operation], CATALOG_ITEMS_BATCH_SIZE)
+    ]
+    if not chunks:
+        return result
+
+    logger.info(f"Syncing catalog {catalog_name}: {len(chunks)} chunks")
+
+    results = await gather_bounded(
+        [
+            lambda method=method, chunk=chunk: _send_catalog_items_chunk(
+                bctx, catalog_name, method, chunk
+            )
+            for method, chunk in chunks
+        ],
+        max_concurrency,
     )
 
-    return handle_response(response, dict, "delete catalog items", logger)
+    errors = []
+    for (method, chunk), chunk_result in zip(chunks, results):
+        item_ids = [str(item["id"]) for item in chunk]
+        operation = CATALOG_ITEM_OPERATIONS[method]
+
+        if isinstance(chunk_result, BaseException) or "error" in chunk_result:
+            # Not confirmed by Braze: keep the old snapshot so the next sync retries the items
+            result[SYNC_COUNT_KEYS[operation]] -= len(chunk)
+            error = (
+                describe_exception(chunk_result)
+                if isinstance(chunk_result, BaseException)
+                else {"type": chunk_result["error"], "message": chunk_result.get("message", "")}
+            )
+            errors.append({**error, "operation": operation, "item_ids": item_ids})
+            continue
+
+        for item_id in item_ids:
+            if method == "DELETE":
+                snapshot.pop(item_id, None)
+            else:
+                snapshot[item_id] = desired_hashes[item_id]
+
+    _save_catalog_snapshot(snapshot_file, snapshot)
+
+    if errors:
+        result["message"] = "failed" if len(errors) == len(chunks) else "partial_success"
+        result["chunks_failed"] = len(errors)
+        result["errors"] = errors
+
+    return result
+
+
+def _read_catalog_items(file_path: Path) -> list[dict[str, Any]]:
+    """Load catalog items from a JSON or NDJSON desired-state file."""
+    with file_path.open(encoding="utf-8") as handle:
+        if file_path.suffix.lower() in (".ndjson", ".jsonl"):
+            items = [json.loads(line) for line in handle if line.strip()]
+        else:
+            items = json.load(handle)
+
+    if isinstance(items, dict):
+        items = items.get("items")
+    if not isinstance(items, list):
+        raise ValueError(f"{file_path} must contain a list of catalog items")
+
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or "id" not in item:
+            raise ValueError(f"Item {index} in {file_path} must be an object with an id field")
+
+    return items
+
+
+def _item_hash(item: dict[str, Any]) -> str:
+    """Content hash of a catalog item, independent of key order."""
+    canonical = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _catalog_snapshot_path(base_url: str, catalog_name: str) -> Path:
+    """Default snapshot file for a catalog, kept separately per workspace."""
+    workspace = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:12]
+    return CATALOG_SNAPSHOT_DIR / f"{catalog_name}-{workspace}.json"
+
+
+def _load_catalog_snapshot(path: Path) -> dict[str, str]:
+    """Load the item hashes last pushed for a catalog (empty if there is no usable snapshot)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable catalog snapshot {path}: {e}")
+        return {}
+
+    items = data.get("items") if isinstance(data, dict) else None
+    return items if isinstance(items, dict) else {}
+
+
+def _save_catalog_snapshot(path: Path, items: dict[str, str]) -> None:
+    """Persist catalog item hashes atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps({"items": items}, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 # ============================================================================
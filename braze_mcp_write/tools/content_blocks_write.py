@@ -111,7 +111,7 @@ async def update_content_block(
     bctx = get_braze_context(ctx)
 
     response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
+        bctx.http_client, bctx.base_url, url_path, body=body, method="POST", idempotent=True
     )
 
     return handle_response(response, dict, "update content block", logger)
@@ -0,0 +1,153 @@
+"""
+Diagnostic operations for Braze MCP server.
+
+This module provides read-only functions for inspecting the server's
+HTTP client, rate limits, caches and background jobs. They never call the Braze API.
+"""
+
+from typing import Any
+
+from mcp.server.fastmcp import Context
+
+from braze_mcp_write.utils import get_braze_context, get_job_queue, get_logger, get_pool_stats
+from braze_mcp_write.utils.cache import response_cache, single_flight
+from braze_mcp_write.utils.idempotency import idempotency_cache
+from braze_mcp_write.utils.safety import BRAZE_ENDPOINT_LIMITS, rate_limit_budget, rate_limiter
+
+__register_mcp_tools__ = True
+__mcp_tool_access__ = "read"
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# HTTP CLIENT
+# ============================================================================
+
+
+async def get_http_pool_stats(ctx: Context) -> dict[str, Any]:
+    """Get connection pool statistics for the shared Braze HTTP client.
+
+    Use this to size BRAZE_HTTP_MAX_CONNECTIONS and BRAZE_HTTP_MAX_KEEPALIVE_CONNECTIONS under load.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with pool configuration, connection counts by state, queued requests and protocols in use
+    """
+    bctx = get_braze_context(ctx)
+
+    return get_pool_stats(bctx)
+
+
+# ============================================================================
+# RATE LIMITS
+# ============================================================================
+
+
+async def get_rate_limit_status(ctx: Context) -> dict[str, Any]:
+    """Get the live Braze rate limit budget for each endpoint family.
+
+    Remaining budgets come from the X-RateLimit-* headers of the most recent Braze responses.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with the budget Braze last reported per endpoint family and the local per-endpoint limiter state
+    """
+    local_limits = {}
+    for family, (limit, window_seconds) in BRAZE_ENDPOINT_LIMITS.items():
+        bucket = rate_limiter.buckets.get(f"endpoint:{family}")
+        local_limits[family] = {
+            "limit": limit,
+            "window_seconds": window_seconds,
+            "available": bucket.available if bucket else limit,
+        }
+
+    return {
+        "braze_reported": rate_limit_budget.snapshot(),
+        "local_limits": local_limits,
+    }
+
+
+# ============================================================================
+# BACKGROUND JOBS
+# ============================================================================
+
+
+async def get_job_status(
+    ctx: Context,
+    job_id: str,
+    include_results: bool = False,
+) -> dict[str, Any]:
+    """Get the status and chunk progress of a background job.
+
+    Args:
+        ctx: The MCP context
+        job_id: Job identifier returned by submit_job
+        include_results: If True, include the result of every finished chunk
+
+    Returns:
+        Dictionary with the job status (queued, running, succeeded, partial_success, failed or cancelled) and succeeded/failed/pending chunk counts
+    """
+    job = get_job_queue(ctx).get_job(job_id, include_results)
+    if job is None:
+        raise ValueError(f"Job not found: {job_id}")
+
+    return job
+
+
+async def list_jobs(
+    ctx: Context,
+    status: str | None = None,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """List recent background jobs.
+
+    Args:
+        ctx: The MCP context
+        status: Only list jobs with this status (queued, running, succeeded, partial_success, failed or cancelled)
+        limit: Maximum number of jobs to return
+
+    Returns:
+        Dictionary with job summaries, newest first
+    """
+    jobs = get_job_queue(ctx).list_jobs(status, limit)
+
+    return {"jobs": jobs, "count": len(jobs)}
+
+
+# ============================================================================
+# IDEMPOTENCY
+# ============================================================================
+
+
+async def get_idempotency_stats(ctx: Context) -> dict[str, Any]:
+    """Get statistics for the write deduplication cache used by call_function.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with the cache TTL, occupancy, in-flight calls and replayed (hits) versus executed (misses) writes
+    """
+    return idempotency_cache.stats()
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+
+async def get_response_cache_stats(ctx: Context) -> dict[str, Any]:
+    """Get statistics for the cache of GET responses from the Braze API.
+
+    Args:
+        ctx: The MCP context
+
+    Returns:
+        Dictionary with the cache TTL, occupancy, hit/miss counts and ratio, LRU evictions, write invalidations, and single_flight counts of GET requests sent versus shared with an identical request in flight
+    """
+    return {**response_cache.stats(), "single_flight": single_flight.stats()}
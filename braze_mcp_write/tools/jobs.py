@@ -0,0 +1,106 @@
+"""
+Background job operations for Braze MCP server.
+
+This module provides functions for running bulk write operations as durable
+background jobs and for cancelling them. Job status and listing live in the
+read-only diagnostics module.
+"""
+
+from typing import Any
+
+from mcp.server.fastmcp import Context
+
+from braze_mcp_write.utils import get_job_queue, get_logger, validate_json_schema
+from braze_mcp_write.utils.jobs import split_job_parameters
+
+__register_mcp_tools__ = True
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# JOB SUBMISSION
+# ============================================================================
+
+
+async def submit_job(
+    ctx: Context,
+    function_name: str,
+    parameters: dict[str, Any],
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Run a write function as a durable background job.
+
+    The call is saved to the local job database before it runs. Large lists (users/track objects,
+    aliases to identify, catalog items, recipients) are split into API-sized chunks, and each chunk
+    is checkpointed as it completes, so a job interrupted by a restart resumes without resending
+    completed chunks.
+
+    Args:
+        ctx: The MCP context
+        function_name: Name of the write function to run (use list_functions to see available options)
+        parameters: Parameters to pass to the function
+        dry_run: If True, validates the parameters and returns the chunk plan without queueing
+
+    Returns:
+        Dictionary with the job_id, status and number of chunks
+    """
+    from braze_mcp_write.registry_builder import FUNCTION_REGISTRY
+
+    # Only write functions run as jobs; job management functions must not enqueue jobs
+    func_info = FUNCTION_REGISTRY.get(function_name)
+    if (
+        func_info is None
+        or func_info.get("module") == __name__.rsplit(".", 1)[-1]
+        or func_info.get("access", "write") != "write"
+    ):
+        raise ValueError(f"Function '{function_name}' cannot be run as a job")
+
+    errors = validate_json_schema(parameters, func_info.get("input_schema") or {}, "parameters")
+    if errors:
+        raise ValueError("; ".join(errors))
+
+    chunks = split_job_parameters(function_name, parameters)
+
+    if dry_run:
+        return {"function_name": function_name, "dry_run": True, "total_chunks": len(chunks)}
+
+    job = get_job_queue(ctx).submit_job(function_name, chunks)
+    logger.info(f"Queued job {job['job_id']} ({function_name}, {len(chunks)} chunks)")
+
+    return job
+
+
+# ============================================================================
+# JOB CANCELLATION
+# ============================================================================
+
+
+async def cancel_job(
+    ctx: Context,
+    job_id: str,
+    confirm: bool = False,
+) -> dict[str, Any]:
+    """Cancel a queued or running background job.
+
+    Chunks that were already sent are not rolled back; chunks not yet started are skipped.
+
+    Args:
+        ctx: The MCP context
+        job_id: Job identifier returned by submit_job
+        confirm: Must be True to cancel the job
+
+    Returns:
+        Dictionary with the job's status after cancellation
+    """
+    if not confirm:
+        return {
+            "error": "Confirmation required",
+            "message": "Set confirm=True to cancel the job",
+        }
+
+    job = get_job_queue(ctx).cancel_job(job_id)
+    if job is None:
+        raise ValueError(f"Job not found: {job_id}")
+
+    return job
@@ -5,16 +5,53 @@ This module provides functions for updating user attributes, tracking events,
 purchases, and managing user profiles.
 """
 
-from typing import Any
-
+import asyncio
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
 from mcp.server.fastmcp import Context
 
-from braze_mcp_write.utils import get_braze_context, get_logger, handle_response, make_request
+from braze_mcp_write.utils import (
+    MAX_CONCURRENT_REQUESTS,
+    USERS_DELETE_BATCH_SIZE,
+    USERS_IDENTIFY_BATCH_SIZE,
+    USERS_TRACK_BATCH_SIZE,
+    BrazeContext,
+    MicroBatcher,
+    chunked,
+    describe_exception,
+    gather_bounded,
+    get_braze_context,
+    get_logger,
+    handle_response,
+    make_request,
+    rate_limiter,
+)
+from braze_mcp_write.utils.safety import MAX_USER_DELETES_PER_MIN, MAX_USER_IDENTIFIES_PER_MIN
 
 __register_mcp_tools__ = True
 
 logger = get_logger(__name__)
 
+TRACK_ARRAYS = ("attributes", "events", "purchases")
+
+# Single-record calls (update_user_attributes, track_event, track_purchase) made
+# within this window are merged into one users/track request. 0 disables coalescing.
+TRACK_COALESCE_WINDOW_MS = float(os.getenv("BRAZE_TRACK_COALESCE_WINDOW_MS", "20"))
+TRACK_COALESCE_MAX_RECORDS = min(
+    int(os.getenv("BRAZE_TRACK_COALESCE_MAX_RECORDS", str(USERS_TRACK_BATCH_SIZE))),
+    USERS_TRACK_BATCH_SIZE,
+)
+
+# Maximum number of row errors included in a file ingestion report
+MAX_REPORTED_ROW_ERRORS = 100
+
+FILE_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
 
 # ============================================================================
 # USER TRACK - ATTRIBUTES, EVENTS, PURCHASES
@@ -34,6 +71,10 @@ async def track_user_data(
     This is the primary endpoint for updating user profiles and tracking behavior.
     You can batch multiple operations together for efficiency.
 
+    Lists longer than the users/track limit (75 objects of each type) are split
+    into API-sized chunks that are sent concurrently, and the per-chunk results
+    are merged into a single response.
+
     Args:
         ctx: The MCP context
         attributes: List of attribute objects. Each contains external_id or user_alias, and custom attribute name/value pairs
@@ -42,31 +83,216 @@ async def track_user_data(
         dry_run: If True, validates but doesn't track
 
     Returns:
-        Dictionary with processing results and any errors
+        Dictionary with processing results and any errors. Error indexes refer to positions in the original lists
     """
-    url_path = "users/track"
-
-    body: dict[str, Any] = {}
-
-    if attributes:
-        body["attributes"] = attributes
-    if events:
-        body["events"] = events
-    if purchases:
-        body["purchases"] = purchases
-
     if not any([attributes, events, purchases]):
         raise ValueError("Must provide at least one of: attributes, events, or purchases")
 
     bctx = get_braze_context(ctx)
 
+    chunks = _build_track_chunks(
+        {"attributes": attributes or [], "events": events or [], "purchases": purchases or []}
+    )
+
+    if len(chunks) == 1:
+        return await _send_track_chunk(bctx, chunks[0]["body"])
+
+    logger.info(f"Splitting users/track payload into {len(chunks)} chunks")
+
+    results = await gather_bounded(
+        [lambda chunk=chunk: _send_track_chunk(bctx, chunk["body"]) for chunk in chunks]
+    )
+
+    return _merge_track_results(chunks, results)
+
+
+def _build_track_chunks(arrays: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Pack attributes, events and purchases into users/track request bodies.
+
+    Each body carries up to USERS_TRACK_BATCH_SIZE objects of every type, and
+    records the offset of each array slice so errors can be mapped back to
+    the caller's original row indexes.
+    """
+    split = {name: chunked(arrays[name], USERS_TRACK_BATCH_SIZE) for name in TRACK_ARRAYS}
+    chunk_count = max(len(parts) for parts in split.values())
+
+    chunks = []
+    for i in range(chunk_count):
+        body: dict[str, Any] = {}
+        offsets: dict[str, int] = {}
+
+        for name in TRACK_ARRAYS:
+            if i < len(split[name]):
+                offset, items = split[name][i]
+                body[name] = list(items)
+                offsets[name] = offset
+
+        chunks.append({"body": body, "offsets": offsets})
+
+    return chunks
+
+
+async def _send_track_chunk(bctx: BrazeContext, body: dict[str, Any]) -> dict[str, Any]:
+    """Send a single users/track request body."""
     response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
+        bctx.http_client, bctx.base_url, "users/track", body=body, method="POST"
     )
 
     return handle_response(response, dict, "track user data", logger)
 
 
+def _merge_track_results(
+    chunks: list[dict[str, Any]], results: list[dict[str, Any] | BaseException]
+) -> dict[str, Any]:
+    """Merge per-chunk users/track results into a single response.
+
+    Braze reports errors with an index relative to the request body, so each
+    error index is shifted by the chunk's offset into the original list. A
+    chunk whose request failed outright reports the full index range it covered.
+    """
+    merged: dict[str, Any] = {
+        "message": "success",
+        "attributes_processed": 0,
+        "events_processed": 0,
+        "purchases_processed": 0,
+        "chunks": len(chunks),
+        "chunks_failed": 0,
+        "errors": [],
+    }
+
+    for i, (chunk, result) in enumerate(zip(chunks, results)):
+        offsets = chunk["offsets"]
+
+        if isinstance(result, BaseException) or "error" in result:
+            merged["chunks_failed"] += 1
+            error = (
+                describe_exception(result)
+                if isinstance(result, BaseException)
+                else {"type": result["error"], "message": result.get("message", "")}
+            )
+            for name, offset in offsets.items():
+                merged["errors"].append(
+                    {
+                        **error,
+                        "chunk": i,
+                        "input_array": name,
+                        "index_range": [offset, offset + len(chunk["body"][name]) - 1],
+                    }
+                )
+            continue
+
+        for name in TRACK_ARRAYS:
+            merged[f"{name}_processed"] += result.get(f"{name}_processed", 0) or 0
+
+        for error in result.get("errors", []):
+            error = {**error, "chunk": i}
+            input_array = error.get("input_array")
+            if input_array in offsets and isinstance(error.get("index"), int):
+                error["index"] += offsets[input_array]
+            merged["errors"].append(error)
+
+    if merged["chunks_failed"] == len(chunks):
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise failures[0]
+        merged["message"] = "failed"
+    elif merged["chunks_failed"]:
+        merged["message"] = "partial_success"
+
+    return merged
+
+
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+
+def _get_track_coalescer(bctx: BrazeContext) -> MicroBatcher:
+    """Return the users/track coalescer for a Braze context, creating it on first use.
+
+    The coalescer is stored on the context, so it is flushed and dropped with the
+    context's HTTP client when braze_lifespan shuts down.
+    """
+    coalescer = bctx.batchers.get("users/track")
+    if coalescer is None:
+        coalescer = bctx.batchers["users/track"] = MicroBatcher(
+            lambda records: _flush_track_records(bctx, records),
+            window=TRACK_COALESCE_WINDOW_MS / 1000,
+            max_items=TRACK_COALESCE_MAX_RECORDS,
+        )
+    return coalescer
+
+
+async def _flush_track_records(
+    bctx: BrazeContext, records: list[tuple[str, dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    """Send coalesced single-record calls as one users/track request.
+
+    Braze reports errors by input array and index, which identifies the record
+    (and so the caller) each error belongs to. If Braze rejects the whole body
+    with a 4xx, the records are resent one at a time so that one caller's
+    malformed record doesn't fail the others' writes.
+    """
+    body: dict[str, list[dict[str, Any]]] = {}
+    positions = []
+    for input_array, record in records:
+        items = body.setdefault(input_array, [])
+        positions.append((input_array, len(items)))
+        items.append(record)
+
+    if len(records) > 1:
+        logger.debug(f"Coalesced {len(records)} single-record calls into one users/track request")
+
+    try:
+        result = await _send_track_chunk(bctx, body)
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        if len(records) == 1 or not 400 <= status < 500 or status == 429:
+            raise
+        # A rejected request was not applied, so resending its records is safe
+        logger.warning(
+            f"users/track rejected {len(records)} coalesced records (HTTP {status}); "
+            "resending them one at a time"
+        )
+        results = await gather_bounded(
+            [lambda record=record: _flush_track_records(bctx, [record]) for record in records]
+        )
+        return [
+            result if isinstance(result, BaseException) else result[0] for result in results
+        ]
+
+    if "error" in result:
+        return [result] * len(records)
+
+    errors_by_position: dict[tuple[str, int], list[dict[str, Any]]] = {}
+    for error in result.get("errors", []):
+        position = (error.get("input_array"), error.get("index"))
+        errors_by_position.setdefault(position, []).append({**error, "index": 0})
+
+    outcomes = []
+    for input_array, index in positions:
+        errors = errors_by_position.get((input_array, index), [])
+        outcomes.append(
+            {
+                "message": result.get("message"),
+                f"{input_array}_processed": 0 if errors else 1,
+                "errors": errors,
+                "coalesced_records": len(records),
+            }
+        )
+    return outcomes
+
+
+async def _track_single_record(
+    ctx: Context, input_array: str, record: dict[str, Any], dry_run: bool
+) -> dict[str, Any]:
+    """Track one attribute, event or purchase record, coalescing it with concurrent calls."""
+    if dry_run or TRACK_COALESCE_WINDOW_MS <= 0:
+        return await track_user_data(ctx, **{input_array: [record]}, dry_run=dry_run)
+
+    bctx = get_braze_context(ctx)
+    return await _get_track_coalescer(bctx).submit((input_array, record))
+
+
 # ============================================================================
 # CONVENIENCE WRAPPERS
 # ============================================================================
@@ -83,6 +309,7 @@ async def update_user_attributes(
     """Update attributes for a single user.
 
     Convenience wrapper around track_user_data for updating a single user's attributes.
+    Concurrent single-record calls are coalesced into shared users/track requests.
 
     Args:
         ctx: The MCP context
@@ -107,7 +334,7 @@ async def update_user_attributes(
 
     attribute_obj["_update_existing_only"] = update_existing_only
 
-    return await track_user_data(ctx, attributes=[attribute_obj], dry_run=dry_run)
+    return await _track_single_record(ctx, "attributes", attribute_obj, dry_run)
 
 
 async def track_event(
@@ -151,7 +378,7 @@ async def track_event(
 
     event_obj["_update_existing_only"] = update_existing_only
 
-    return await track_user_data(ctx, events=[event_obj], dry_run=dry_run)
+    return await _track_single_record(ctx, "events", event_obj, dry_run)
 
 
 async def track_purchase(
@@ -206,7 +433,279 @@ async def track_purchase(
 
     purchase_obj["_update_existing_only"] = update_existing_only
 
-    return await track_user_data(ctx, purchases=[purchase_obj], dry_run=dry_run)
+    return await _track_single_record(ctx, "purchases", purchase_obj, dry_run)
+
+
+# ============================================================================
+# FILE INGESTION
+# ============================================================================
+
+
+async def ingest_user_data_file(
+    ctx: Context,
+    path: str,
+    mapping: dict[str, Any],
+    file_format: str | None = None,
+    max_concurrency: int | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Stream a local CSV or NDJSON file into users/track.
+
+    Rows are read incrementally, mapped to attribute, event or purchase objects, and sent in
+    users/track-sized chunks with bounded concurrency, so memory use does not grow with file size.
+    Progress is reported as rows are dispatched.
+
+    Args:
+        ctx: The MCP context
+        path: Path to a local .csv, .ndjson or .jsonl file
+        mapping: Column mapping spec with record_type (attributes, events or purchases), fields ({target_field: source_column}, e.g. external_id, name, product_id), optional properties ({property: source_column}) for events/purchases, optional constants ({field: value}) and optional types ({field_or_property: string|integer|number|boolean|json}) to convert CSV strings
+        file_format: csv or ndjson (detected from the file extension if not provided)
+        max_concurrency: Maximum number of chunk requests in flight (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
+        dry_run: If True, reads and maps the whole file but doesn't send anything
+
+    Returns:
+        Dictionary with rows read and sent, processed counts, failed chunks and row-numbered errors
+    """
+    record_type = mapping.get("record_type")
+    if record_type not in TRACK_ARRAYS:
+        raise ValueError(f"mapping.record_type must be one of: {', '.join(TRACK_ARRAYS)}")
+    if not mapping.get("fields"):
+        raise ValueError("mapping.fields must map at least one target field to a source column")
+
+    file_path = Path(path).expanduser()
+    file_format = file_format or FILE_FORMATS.get(file_path.suffix.lower())
+    if file_format not in ("csv", "ndjson"):
+        raise ValueError("file_format must be csv or ndjson (could not detect it from the extension)")
+    if not file_path.is_file():
+        raise ValueError(f"File not found: {file_path}")
+
+    bctx = None if dry_run else get_braze_context(ctx)
+    report: dict[str, Any] = {
+        "message": "success",
+        "dry_run": dry_run,
+        "rows_read": 0,
+        "rows_sent": 0,
+        f"{record_type}_processed": 0,
+        "chunks": 0,
+        "chunks_failed": 0,
+        "errors_total": 0,
+        "errors": [],
+    }
+
+    def add_error(error: dict[str, Any]) -> None:
+        report["errors_total"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ROW_ERRORS:
+            report["errors"].append(error)
+
+    async def send(chunk: int, rows: list[int], records: list[dict[str, Any]]) -> None:
+        try:
+            result = await _send_track_chunk(bctx, {record_type: records})
+        except Exception as e:
+            report["chunks_failed"] += 1
+            add_error({**describe_exception(e), "chunk": chunk, "rows": [rows[0], rows[-1]]})
+            return
+        finally:
+            semaphore.release()
+
+        if "error" in result:
+            # An undecodable or truncated response: Braze's outcome for the chunk is unknown
+            report["chunks_failed"] += 1
+            add_error(
+                {
+                    "type": result["error"],
+                    "message": result.get("message", ""),
+                    "chunk": chunk,
+                    "rows": [rows[0], rows[-1]],
+                }
+            )
+            return
+
+        report[f"{record_type}_processed"] += result.get(f"{record_type}_processed", 0) or 0
+        for error in result.get("errors", []):
+            index = error.get("index")
+            row = rows[index] if isinstance(index, int) and 0 <= index < len(rows) else None
+            add_error({**error, "chunk": chunk, "row": row})
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or MAX_CONCURRENT_REQUESTS))
+    tasks: set[asyncio.Task] = set()
+
+    read_failed = False
+
+    try:
+        handle = file_path.open(newline="", encoding="utf-8-sig")
+    except OSError as e:
+        raise ValueError(f"Cannot open {file_path}: {e.strerror or e}")
+
+    with handle:
+        rows = _iter_mapped_rows(handle, file_format, mapping)
+
+        try:
+            while True:
+                # Only read the next chunk once it can be dispatched, keeping memory flat
+                if not dry_run:
+                    await semaphore.acquire()
+
+                batch = await asyncio.to_thread(_read_batch, rows, USERS_TRACK_BATCH_SIZE)
+                if not batch:
+                    if not dry_run:
+                        semaphore.release()
+                    break
+
+                row_numbers, records = [], []
+                for row_number, record, error in batch:
+                    if error and error["type"] == "file_error":
+                        # Text is decoded ahead of the CSV reader, so no exact row is known
+                        read_failed = True
+                        add_error(error)
+                        continue
+
+                    report["rows_read"] += 1
+                    if error:
+                        add_error({**error, "row": row_number})
+                    else:
+                        row_numbers.append(row_number)
+                        records.append(record)
+
+                if not records:
+                    if not dry_run:
+                        semaphore.release()
+                    continue
+
+                report["chunks"] += 1
+                report["rows_sent"] += len(records)
+
+                if dry_run:
+                    continue
+
+                task = asyncio.create_task(send(report["chunks"] - 1, row_numbers, records))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await _report_progress(ctx, report["rows_read"])
+
+            await asyncio.gather(*tasks)
+        finally:
+            # Don't leave chunk requests running if reading or dispatching was interrupted
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    await _report_progress(ctx, report["rows_read"])
+
+    report["errors_truncated"] = report["errors_total"] > len(report["errors"])
+    if report["chunks"] and report["chunks_failed"] == report["chunks"]:
+        report["message"] = "failed"
+    elif read_failed and not report["rows_sent"]:
+        report["message"] = "failed"
+    elif report["chunks_failed"] or report["errors_total"]:
+        report["message"] = "partial_success"
+
+    logger.info(
+        f"Ingested {report['rows_sent']}/{report['rows_read']} rows from {file_path} "
+        f"in {report['chunks']} chunks ({report['chunks_failed']} failed)"
+    )
+    return report
+
+
+def _iter_mapped_rows(
+    handle: Any, file_format: str, mapping: dict[str, Any]
+) -> Iterator[tuple[int, dict[str, Any] | None, dict[str, str] | None]]:
+    """Yield (row_number, record, error) for each data row of an open CSV or NDJSON file.
+
+    Errors are dictionaries with a type and message. Malformed rows are reported as
+    invalid_row; a file that cannot be read or decoded ends the iteration with a file_error.
+    """
+    if file_format == "csv":
+        source_rows = iter(csv.DictReader(handle))
+    else:
+        source_rows = iter(handle)
+
+    row_number = 0
+    while True:
+        row_number += 1
+        try:
+            row = next(source_rows)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield row_number, None, {"type": "invalid_row", "message": f"malformed CSV: {e}"}
+            continue
+        except (UnicodeDecodeError, OSError) as e:
+            yield row_number, None, {"type": "file_error", "message": f"cannot read file: {e}"}
+            return
+
+        try:
+            if file_format == "ndjson":
+                if not row.strip():
+                    continue
+                row = json.loads(row)
+                if not isinstance(row, dict):
+                    raise ValueError("line is not a JSON object")
+            yield row_number, _map_row(row, mapping), None
+        except ValueError as e:
+            yield row_number, None, {"type": "invalid_row", "message": str(e)}
+
+
+def _map_row(row: dict[str, Any], mapping: dict[str, Any]) -> dict[str, Any]:
+    """Build a users/track object from a source row using a column mapping spec."""
+    types = mapping.get("types", {})
+    record: dict[str, Any] = dict(mapping.get("constants", {}))
+
+    for target, column in mapping["fields"].items():
+        value = row.get(column)
+        if value not in (None, ""):
+            record[target] = _convert_value(value, types.get(target), target)
+
+    properties = {}
+    for target, column in mapping.get("properties", {}).items():
+        value = row.get(column)
+        if value not in (None, ""):
+            properties[target] = _convert_value(value, types.get(target), target)
+    if properties:
+        record["properties"] = {**record.get("properties", {}), **properties}
+
+    return record
+
+
+def _convert_value(value: Any, type_name: str | None, field_name: str) -> Any:
+    """Convert a raw (CSV string) value to the type declared in the mapping."""
+    if type_name is None or not isinstance(value, str):
+        return value
+
+    try:
+        if type_name == "integer":
+            return int(value)
+        if type_name == "number":
+            return float(value)
+        if type_name == "boolean":
+            if value.strip().lower() not in ("true", "false", "1", "0", "yes", "no"):
+                raise ValueError(value)
+            return value.strip().lower() in ("true", "1", "yes")
+        if type_name == "json":
+            return json.loads(value)
+        return value
+    except ValueError:
+        raise ValueError(f"{field_name}: cannot convert {value!r} to {type_name}")
+
+
+def _read_batch(rows: Iterator, size: int) -> list:
+    """Read up to `size` items from an iterator (run in a worker thread)."""
+    batch = []
+    for item in rows:
+        batch.append(item)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+async def _report_progress(ctx: Context, rows_read: int) -> None:
+    """Report ingestion progress to the MCP client when supported."""
+    report_progress = getattr(ctx, "report_progress", None)
+    if report_progress is None:
+        return
+    try:
+        await report_progress(rows_read)
+    except Exception:
+        logger.debug("Could not report progress", exc_info=True)
 
 
 # ============================================================================
@@ -262,6 +761,81 @@ async def delete_user(
     return handle_response(response, dict, "delete user", logger)
 
 
+async def bulk_delete_users(
+    ctx: Context,
+    external_ids: list[str] | None = None,
+    user_aliases: list[dict[str, str]] | None = None,
+    braze_ids: list[str] | None = None,
+    checkpoint_path: str | None = None,
+    max_concurrency: int | None = None,
+    dry_run: bool = False,
+    confirm: bool = False,
+) -> dict[str, Any]:
+    """Delete many users from the Braze database, e.g. for an erasure batch.
+
+    WARNING: This is a destructive operation that cannot be undone.
+
+    Ids are sent 50 per users/delete request, with shards running concurrently under the
+    BRAZE_MAX_USER_DELETES_PER_MIN limit. With a checkpoint_path, every completed shard is
+    recorded, and re-running the same batch skips the ids already deleted.
+
+    Args:
+        ctx: The MCP context
+        external_ids: External IDs of the users to delete
+        user_aliases: User alias objects (alias_name and alias_label) of the users to delete
+        braze_ids: Braze internal IDs of the users to delete
+        checkpoint_path: File recording the ids of completed shards, used to resume an interrupted batch
+        max_concurrency: Maximum number of requests in flight (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
+        dry_run: If True, reports how many ids would be deleted and skipped without deleting
+        confirm: Must be True to execute this destructive operation
+
+    Returns:
+        Dictionary with deleted, succeeded, skipped and failed counts and the outcome of each id (succeeded, skipped, or failed with its error)
+    """
+    ids = (
+        [("external_ids", value, f"external_id:{value}") for value in external_ids or []]
+        + [("user_aliases", value, _alias_key(value)) for value in user_aliases or []]
+        + [("braze_ids", value, f"braze_id:{value}") for value in braze_ids or []]
+    )
+    if not ids:
+        raise ValueError("Must provide at least one of: external_ids, user_aliases, or braze_ids")
+
+    if not confirm and not dry_run:
+        return {
+            "error": "Confirmation required",
+            "message": f"Set confirm=True to delete {len(ids)} users. This cannot be undone.",
+        }
+
+    async def send(shard: list[tuple[str, Any, str]]) -> dict[str, Any]:
+        body: dict[str, list[Any]] = {}
+        for array, value, _ in shard:
+            body.setdefault(array, []).append(value)
+
+        await rate_limiter.acquire("users_delete", MAX_USER_DELETES_PER_MIN, 60)
+        # Deleting a user that is already gone is a no-op, so retries are safe
+        response = await make_request(
+            bctx.http_client,
+            bctx.base_url,
+            "users/delete",
+            body=body,
+            method="POST",
+            idempotent=True,
+        )
+        return handle_response(response, dict, "bulk delete users", logger)
+
+    bctx = get_braze_context(ctx)
+
+    return await _send_user_shards(
+        send,
+        ids,
+        USERS_DELETE_BATCH_SIZE,
+        "deleted",
+        checkpoint_path,
+        max_concurrency,
+        dry_run,
+    )
+
+
 # ============================================================================
 # USER IDENTIFICATION (ALIAS TO EXTERNAL ID)
 # ============================================================================
@@ -270,6 +844,8 @@ async def delete_user(
 async def identify_users(
     ctx: Context,
     aliases_to_identify: list[dict[str, Any]],
+    checkpoint_path: str | None = None,
+    max_concurrency: int | None = None,
     dry_run: bool = False,
 ) -> dict[str, Any]:
     """Identify users by associating an external_id with a user alias.
@@ -277,23 +853,187 @@ async def identify_users(
     This allows you to merge user profiles when you later learn a user's external_id
     but initially only had an alias.
 
+    Lists over 50 aliases are sent in concurrent users/identify requests under the
+    BRAZE_MAX_USER_IDENTIFIES_PER_MIN limit. With a checkpoint_path, every completed
+    shard is recorded, and re-running the same list skips the aliases already identified.
+
     Args:
         ctx: The MCP context
         aliases_to_identify: List of identification objects. Each contains external_id and user_alias with alias_name and alias_label
+        checkpoint_path: File recording the aliases of completed shards, used to resume an interrupted run
+        max_concurrency: Maximum number of requests in flight (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
         dry_run: If True, validates but doesn't identify
 
     Returns:
-        Dictionary with identification results
+        Dictionary with identification results. Sharded runs also report the outcome of each alias
     """
     url_path = "users/identify"
 
-    body = {"aliases_to_identify": aliases_to_identify}
+    async def send(shard: list[tuple[str, Any, str]]) -> dict[str, Any]:
+        body = {"aliases_to_identify": [value for _, value, _ in shard]}
+
+        await rate_limiter.acquire("users_identify", MAX_USER_IDENTIFIES_PER_MIN, 60)
+        # Identifying an alias that is already identified is a no-op, so retries are safe
+        response = await make_request(
+            bctx.http_client, bctx.base_url, url_path, body=body, method="POST", idempotent=True
+        )
+        return handle_response(response, dict, "identify users", logger)
 
     bctx = get_braze_context(ctx)
 
-    response = await make_request(
-        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
+    items = [
+        (
+            "aliases_to_identify",
+            value,
+            f"{value.get('external_id')}<-{_alias_key(value.get('user_alias'))}",
+        )
+        for value in aliases_to_identify
+    ]
+
+    if len(items) <= USERS_IDENTIFY_BATCH_SIZE and checkpoint_path is None and not dry_run:
+        return await send(items)
+
+    return await _send_user_shards(
+        send,
+        items,
+        USERS_IDENTIFY_BATCH_SIZE,
+        "aliases_processed",
+        checkpoint_path,
+        max_concurrency,
+        dry_run,
+    )
+
+
+# ============================================================================
+# SHARDED USER OPERATIONS
+# ============================================================================
+
+
+def _alias_key(user_alias: dict[str, Any] | None) -> str:
+    """Stable identifier of a user alias for outcome reports and checkpoints."""
+    user_alias = user_alias or {}
+    return f"user_alias:{user_alias.get('alias_label')}:{user_alias.get('alias_name')}"
+
+
+async def _send_user_shards(
+    send: Any,
+    items: list[tuple[str, Any, str]],
+    shard_size: int,
+    count_field: str,
+    checkpoint_path: str | None,
+    max_concurrency: int | None,
+    dry_run: bool,
+) -> dict[str, Any]:
+    """Send (array, value, key) items in concurrent shards, with an optional checkpoint.
+
+    Keys recorded in the checkpoint file are skipped. Each shard's keys are appended to the
+    checkpoint as soon as Braze accepts it, so an interrupted run resumes where it stopped;
+    shards that raised or returned an error dict are left out and sent again on resume.
+    """
+    checkpoint = Path(checkpoint_path).expanduser() if checkpoint_path else None
+    done = _load_user_checkpoint(checkpoint) if checkpoint else set()
+
+    outcomes: dict[str, Any] = {}
+    pending = []
+    for item in items:
+        if item[2] in done:
+            outcomes[item[2]] = "skipped"
+        else:
+            pending.append(item)
+
+    report: dict[str, Any] = {
+        "message": "success",
+        "dry_run": dry_run,
+        count_field: 0,
+        "succeeded": 0,
+        "skipped": len(items) - len(pending),
+        "failed": 0,
+    }
+
+    if dry_run:
+        report["pending"] = len(pending)
+        return report
+
+    shards = [list(shard) for _, shard in chunked(pending, shard_size)]
+    if len(shards) > 1:
+        logger.info(f"Splitting {len(pending)} ids into {len(shards)} requests")
+
+    checkpoint_errors: list[str] = []
+
+    async def run(shard: list[tuple[str, Any, str]]) -> dict[str, Any]:
+        result = await send(shard)
+        if checkpoint and "error" not in result:
+            try:
+                _append_user_checkpoint(checkpoint, [key for _, _, key in shard])
+            except OSError as e:
+                # Braze already applied the shard; only a resumed run would send it again
+                logger.warning(f"Could not write checkpoint {checkpoint}: {e}")
+                checkpoint_errors.append(str(e))
+        return result
+
+    results = await gather_bounded(
+        [lambda shard=shard: run(shard) for shard in shards], max_concurrency
     )
 
-    return handle_response(response, dict, "identify users", logger)
+    errors = []
+    for i, (shard, result) in enumerate(zip(shards, results)):
+        if isinstance(result, BaseException) or "error" in result:
+            error = (
+                describe_exception(result)
+                if isinstance(result, BaseException)
+                else {"type": result["error"], "message": result.get("message", "")}
+            )
+            report["failed"] += len(shard)
+            for _, _, key in shard:
+                outcomes[key] = {"status": "failed", **error}
+            continue
+
+        report["succeeded"] += len(shard)
+        report[count_field] += result.get(count_field, 0) or 0
+        for _, _, key in shard:
+            outcomes[key] = "succeeded"
+        errors.extend(
+            {**error, "shard": i} if isinstance(error, dict) else {"message": error, "shard": i}
+            for error in result.get("errors") or []
+        )
+
+    if shards and report["failed"] == len(pending):
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise failures[0]
+        report["message"] = "failed"
+    elif report["failed"] or errors:
+        report["message"] = "partial_success"
+    if errors:
+        report["errors"] = errors
+    if checkpoint_errors:
+        report["checkpoint_errors"] = checkpoint_errors
+
+    report["outcomes"] = outcomes
+    return report
+
+
+def _load_user_checkpoint(path: Path) -> set[str]:
+    """Read the ids recorded in a checkpoint file (one JSON list of ids per line)."""
+    done: set[str] = set()
+    try:
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    keys = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash; its shard is simply sent again
+                    continue
+                if isinstance(keys, list) and all(isinstance(key, str) for key in keys):
+                    done.update(keys)
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _append_user_checkpoint(path: Path, keys: list[str]) -> None:
+    """Record the ids of a completed shard."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(keys) + "\n")
 
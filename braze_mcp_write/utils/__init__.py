@@ -2,7 +2,28 @@
 Utility module exports.
 """
 
-from braze_mcp_write.utils.context import BrazeContext, braze_lifespan, get_braze_context
+from braze_mcp_write.utils.batching import (
+    CATALOG_ITEMS_BATCH_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_RECIPIENTS_PER_REQUEST,
+    USERS_DELETE_BATCH_SIZE,
+    USERS_IDENTIFY_BATCH_SIZE,
+    USERS_TRACK_BATCH_SIZE,
+    MicroBatcher,
+    chunked,
+    describe_exception,
+    gather_bounded,
+    send_recipient_shards,
+    send_trigger_request,
+)
+from braze_mcp_write.utils.context import (
+    BrazeContext,
+    HTTPClientConfig,
+    braze_lifespan,
+    get_braze_context,
+    get_job_queue,
+    get_pool_stats,
+)
 from braze_mcp_write.utils.http import handle_response, make_request
 from braze_mcp_write.utils.logging import configure_logging, get_logger
 from braze_mcp_write.utils.safety import (
@@ -14,12 +35,30 @@ from braze_mcp_write.utils.safety import (
     validate_workspace_safety,
     validate_write_enabled,
 )
+from braze_mcp_write.utils.serialization import JSON_BACKEND, decode_json, encode_json
+from braze_mcp_write.utils.validation import validate_json_schema
 
 __all__ = [
+    # Batching
+    "CATALOG_ITEMS_BATCH_SIZE",
+    "MAX_CONCURRENT_REQUESTS",
+    "MAX_RECIPIENTS_PER_REQUEST",
+    "USERS_DELETE_BATCH_SIZE",
+    "USERS_IDENTIFY_BATCH_SIZE",
+    "USERS_TRACK_BATCH_SIZE",
+    "MicroBatcher",
+    "chunked",
+    "describe_exception",
+    "gather_bounded",
+    "send_recipient_shards",
+    "send_trigger_request",
     # Context
     "BrazeContext",
+    "HTTPClientConfig",
     "braze_lifespan",
     "get_braze_context",
+    "get_job_queue",
+    "get_pool_stats",
     # HTTP
     "handle_response",
     "make_request",
@@ -34,5 +73,11 @@ __all__ = [
     "supports_dry_run",
     "validate_workspace_safety",
     "validate_write_enabled",
+    # Serialization
+    "JSON_BACKEND",
+    "decode_json",
+    "encode_json",
+    # Validation
+    "validate_json_schema",
 ]
 
@@ -0,0 +1,339 @@
+"""
+Batching utilities for splitting large payloads into API-sized chunks.
+
+Braze caps the number of objects accepted per request on most bulk endpoints,
+so bulk tools split their inputs with chunked() and dispatch the resulting
+requests with gather_bounded() to keep a bounded number of requests in flight
+over the shared HTTP client. Campaign and Canvas recipient lists are sharded
+the same way by send_recipient_shards().
+"""
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Sequence, TypeVar
+
+from braze_mcp_write.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from braze_mcp_write.utils.context import BrazeContext
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Maximum number of chunk requests a single tool call keeps in flight
+MAX_CONCURRENT_REQUESTS = int(os.getenv("BRAZE_MAX_CONCURRENT_REQUESTS", "5"))
+
+# Braze per-request limits of the bulk endpoints
+# At most 75 objects of each type per users/track request
+USERS_TRACK_BATCH_SIZE = 75
+# At most 50 ids per users/delete request and 50 aliases per users/identify request
+USERS_DELETE_BATCH_SIZE = 50
+USERS_IDENTIFY_BATCH_SIZE = 50
+# At most 50 items per catalog item request
+CATALOG_ITEMS_BATCH_SIZE = 50
+# At most 50 recipients per campaign/canvas trigger request
+MAX_RECIPIENTS_PER_REQUEST = 50
+
+# Recipient fields that identify a user in failed shard reports
+RECIPIENT_ID_FIELDS = ("external_user_id", "user_alias", "email", "braze_id")
+
+# ============================================================================
+# CHUNKING
+# ============================================================================
+
+
+def chunked(items: Sequence[T], size: int) -> list[tuple[int, Sequence[T]]]:
+    """
+    Split a sequence into consecutive chunks.
+
+    Args:
+        items: Sequence to split
+        size: Maximum number of items per chunk
+
+    Returns:
+        List of (offset, chunk) tuples, where offset is the index of the
+        chunk's first item in the original sequence
+
+    Raises:
+        ValueError: If size is not positive
+    """
+    if size <= 0:
+        raise ValueError(f"Chunk size must be positive, got {size}")
+
+    return [(offset, items[offset : offset + size]) for offset in range(0, len(items), size)]
+
+
+# ============================================================================
+# BOUNDED DISPATCH
+# ============================================================================
+
+
+async def gather_bounded(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    max_concurrency: int | None = None,
+) -> list[T | BaseException]:
+    """
+    Run awaitables with a bounded number in flight, preserving order.
+
+    Each factory is only invoked once a slot is free, so no request is
+    built or sent before it can actually be dispatched.
+
+    Args:
+        factories: Zero-argument callables returning the awaitables to run
+        max_concurrency: Maximum number of awaitables in flight
+            (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
+
+    Returns:
+        Results in the same order as the factories. Exceptions raised by an
+        awaitable are returned in its slot instead of being propagated.
+    """
+    limit = max(1, max_concurrency or MAX_CONCURRENT_REQUESTS)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(run(factory) for factory in factories), return_exceptions=True)
+
+
+def describe_exception(exc: BaseException) -> dict[str, Any]:
+    """
+    Build a JSON-serializable description of a failed chunk request.
+
+    Args:
+        exc: Exception raised while sending the chunk
+
+    Returns:
+        Dictionary with the error type, message and HTTP status (when available)
+    """
+    error: dict[str, Any] = {
+        "type": type(exc).__name__,
+        "message": str(exc),
+    }
+
+    response = getattr(exc, "response", None)
+    if response is not None:
+        error["status_code"] = response.status_code
+
+    return error
+
+
+# ============================================================================
+# RECIPIENT SHARDING
+# ============================================================================
+
+
+async def send_recipient_shards(
+    send_shard: Callable[[list[dict[str, Any]]], Awaitable[dict[str, Any]]],
+    recipients: list[dict[str, Any]],
+    shard_size: int = MAX_RECIPIENTS_PER_REQUEST,
+    max_concurrency: int | None = None,
+) -> dict[str, Any]:
+    """
+    Send a recipient list in request-sized shards and merge the responses.
+
+    A list that fits in one request is sent as is and its response returned
+    unchanged. Larger lists are split into shards sent concurrently, and the
+    responses are merged: every dispatch_id is collected, Braze errors are
+    tagged with their shard, and failed shards list the recipients they held.
+    A shard answered with an error dict (an undecodable or truncated response)
+    counts as failed, since Braze's outcome for it is unknown.
+
+    Args:
+        send_shard: Sends one request for the given recipients and returns the parsed response
+        recipients: Full recipient list
+        shard_size: Maximum number of recipients per request
+        max_concurrency: Maximum number of shard requests in flight
+            (defaults to BRAZE_MAX_CONCURRENT_REQUESTS)
+
+    Returns:
+        Merged response with dispatch_ids, shard counts and errors
+
+    Raises:
+        Exception: The first shard failure, if every shard failed and at least one raised
+    """
+    if len(recipients) <= shard_size:
+        return await send_shard(recipients)
+
+    shards = chunked(recipients, shard_size)
+    logger.info(f"Splitting {len(recipients)} recipients into {len(shards)} requests")
+
+    results = await gather_bounded(
+        [lambda shard=shard: send_shard(list(shard)) for _, shard in shards],
+        max_concurrency,
+    )
+
+    merged: dict[str, Any] = {
+        "message": "success",
+        "dispatch_ids": [],
+        "recipients_sent": 0,
+        "shards": len(shards),
+        "shards_failed": 0,
+        "errors": [],
+    }
+
+    for i, ((offset, shard), result) in enumerate(zip(shards, results)):
+        if isinstance(result, BaseException) or "error" in result:
+            merged["shards_failed"] += 1
+            error = (
+                describe_exception(result)
+                if isinstance(result, BaseException)
+                else {"type": result["error"], "message": result.get("message", "")}
+            )
+            merged["errors"].append(
+                {
+                    **error,
+                    "shard": i,
+                    "recipient_range": [offset, offset + len(shard) - 1],
+                    "recipients": [
+                        {key: recipient[key] for key in RECIPIENT_ID_FIELDS if key in recipient}
+                        for recipient in shard
+                    ],
+                }
+            )
+            continue
+
+        merged["recipients_sent"] += len(shard)
+        if result.get("dispatch_id"):
+            merged["dispatch_ids"].append(result["dispatch_id"])
+        for error in result.get("errors") or []:
+            merged["errors"].append(
+                {**error, "shard": i} if isinstance(error, dict) else {"message": error, "shard": i}
+            )
+
+    if merged["shards_failed"] == len(shards):
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise failures[0]
+        merged["message"] = "failed"
+    elif merged["shards_failed"]:
+        merged["message"] = "partial_success"
+
+    return merged
+
+
+async def send_trigger_request(
+    bctx: "BrazeContext", url_path: str, body: dict[str, Any], operation: str
+) -> dict[str, Any]:
+    """
+    Send one campaign or Canvas trigger request, paced by BRAZE_MAX_SENDS_PER_HOUR.
+
+    Args:
+        bctx: Braze context
+        url_path: Trigger endpoint path (e.g. campaigns/trigger/send)
+        body: Request body, with at most MAX_RECIPIENTS_PER_REQUEST recipients
+        operation: Description of the operation (for logging)
+
+    Returns:
+        Parsed Braze response
+    """
+    # Imported here: the HTTP and safety modules import the context, which imports this module
+    from braze_mcp_write.utils.http import handle_response, make_request
+    from braze_mcp_write.utils.safety import MAX_SENDS_PER_HOUR, rate_limiter
+
+    await rate_limiter.acquire("trigger_sends", MAX_SENDS_PER_HOUR, 3600)
+
+    response = await make_request(
+        bctx.http_client, bctx.base_url, url_path, body=body, method="POST"
+    )
+
+    return handle_response(response, dict, operation, logger)
+
+
+# ============================================================================
+# MICRO-BATCHING
+# ============================================================================
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent single-item submissions into batched calls.
+
+    Items submitted within `window` seconds of the first pending item (or until
+    `max_items` are pending) are handed to `flush` together. Each submitter
+    awaits the result for its own item, or the exception raised by `flush`.
+    `flush` may also return an exception in an item's slot to fail only that
+    item's submitter.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[Any]], Awaitable[list[Any]]],
+        window: float,
+        max_items: int,
+    ):
+        self.flush = flush
+        self.window = window
+        self.max_items = max(1, max_items)
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item for the next batch and wait for its result.
+
+        Args:
+            item: Item to include in the batch
+
+        Returns:
+            The result `flush` produced for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_items:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._dispatch)
+
+        return await future
+
+    async def aclose(self) -> None:
+        """Send any pending items now and wait for every batch in flight."""
+        self._dispatch()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.flush([item for item, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except BaseException as e:
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            # Never leave a submitter waiting, even if flush returned too few results
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Batch flush returned no result for item"))
@@ -0,0 +1,263 @@
+"""
+Response cache and request coalescing for read-style (GET) Braze API requests.
+
+Identical concurrent GET requests are collapsed into a single request whose
+response (or exception) every caller receives, whether or not caching is on.
+Successful GET responses are also cached for BRAZE_RESPONSE_CACHE_TTL seconds
+in an LRU keyed by base URL, path and query parameters. Writes evict the cached
+reads of the resource they touch: a write to content_blocks/update with a
+content_block_id evicts the cached content_blocks/* responses for that block
+(and unfiltered listings).
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from braze_mcp_write.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Seconds a GET response is served from the cache (0 disables caching)
+RESPONSE_CACHE_TTL = float(os.getenv("BRAZE_RESPONSE_CACHE_TTL", "60"))
+
+# Maximum number of cached responses
+RESPONSE_CACHE_SIZE = int(os.getenv("BRAZE_RESPONSE_CACHE_SIZE", "512"))
+
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+def cache_key(base_url: str, url_path: str, params: dict[str, Any] | None) -> CacheKey:
+    """Build the cache key of a GET request; parameter order does not matter."""
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+    return base_url, url_path.strip("/"), items
+
+
+def resource_family(url_path: str) -> str:
+    """Top-level resource of an endpoint path (e.g. content_blocks for content_blocks/info)."""
+    return url_path.strip("/").split("/", 1)[0]
+
+
+# ============================================================================
+# SINGLE-FLIGHT
+# ============================================================================
+
+
+class SingleFlight:
+    """
+    Collapse identical concurrent calls into one.
+
+    The first caller for a key starts the call in its own task; callers that
+    arrive while it is running await the same task. Every caller is shielded
+    from the others: cancelling one caller (including the first) does not
+    cancel the shared call, and its result or exception reaches all of them.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Any, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def run(self, key: Any, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the call
+            call: Starts the call (only invoked if none is in flight for key)
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(call())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._tasks
+
+    def stats(self) -> dict[str, Any]:
+        """Counters of executed and shared calls."""
+        return {
+            "in_flight": len(self._tasks),
+            "requests_sent": self.calls,
+            "requests_shared": self.shared,
+        }
+
+    def _finish(self, key: Any, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Nobody may be left awaiting a failed call; mark its exception as retrieved
+        if not task.cancelled():
+            task.exception()
+
+
+# Identical GET requests in flight, shared by the response cache and uncached reads
+single_flight = SingleFlight()
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+
+class ResponseCache:
+    """Async-safe TTL + LRU cache of GET responses with single-flight misses."""
+
+    def __init__(
+        self,
+        ttl: float = RESPONSE_CACHE_TTL,
+        max_entries: int = RESPONSE_CACHE_SIZE,
+        flight: SingleFlight = single_flight,
+    ):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.flight = flight
+        self._entries: OrderedDict[CacheKey, tuple[float, httpx.Response]] = OrderedDict()
+        # Bumped on every invalidation, so a read that started before a write is not cached
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def fetch(
+        self,
+        key: CacheKey,
+        send: Callable[[], Awaitable[httpx.Response]],
+        is_cacheable: Callable[[httpx.Response], bool] | None = None,
+    ) -> httpx.Response:
+        """
+        Return a cached response, or send the request once for all concurrent callers.
+
+        Args:
+            key: Cache key from cache_key()
+            send: Sends the request and returns its (successful) response
+            is_cacheable: Decides whether a response may be stored (defaults to always)
+
+        Returns:
+            The cached or freshly fetched response
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+
+        # Joining a request already in flight counts as a hit: no request is sent
+        if key in self.flight:
+            self.hits += 1
+        else:
+            self.misses += 1
+        family = resource_family(key[1])
+
+        async def send_and_store() -> httpx.Response:
+            generation = self._generations.get(family, 0)
+            response = await send()
+            if self._generations.get(family, 0) == generation and (
+                is_cacheable is None or is_cacheable(response)
+            ):
+                self._store(key, response)
+            return response
+
+        return await self.flight.run(key, send_and_store)
+
+    def invalidate_for_write(
+        self, base_url: str, url_path: str, body: dict[str, Any] | None = None
+    ) -> int:
+        """
+        Evict the cached reads of the resource a write touched.
+
+        Entries of the same resource family are evicted unless they are filtered
+        by an *_id parameter that the write body sets to a different value.
+
+        Args:
+            base_url: Base URL of the write request
+            url_path: Path of the write request
+            body: JSON body of the write request
+
+        Returns:
+            Number of evicted entries
+        """
+        family = resource_family(url_path)
+        self._generations[family] = self._generations.get(family, 0) + 1
+        self.invalidations += 1
+
+        ids = (
+            {
+                k: str(v)
+                for k, v in body.items()
+                if k.endswith("_id") and isinstance(v, (str, int)) and not isinstance(v, bool)
+            }
+            if isinstance(body, dict)
+            else {}
+        )
+
+        evicted = 0
+        for key in list(self._entries):
+            entry_base, entry_path, entry_params = key
+            if entry_base != base_url or resource_family(entry_path) != family:
+                continue
+            params = dict(entry_params)
+            if any(name in params and params[name] != value for name, value in ids.items()):
+                continue
+            del self._entries[key]
+            evicted += 1
+
+        if evicted:
+            logger.debug(f"Evicted {evicted} cached response(s) after write to {url_path}")
+        return evicted
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and cache occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _store(self, key: CacheKey, response: httpx.Response) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Global response cache instance
+response_cache = ResponseCache()
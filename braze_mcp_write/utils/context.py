@@ -4,19 +4,62 @@ Context management for Braze MCP Write Server.
 Handles Braze API context including authentication, base URL, and HTTP client lifecycle.
 """
 
+import asyncio
+import importlib.util
 import os
+import sqlite3
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from typing import Any, AsyncGenerator
 
 import httpx
 from mcp.server.fastmcp import Context
 
+from braze_mcp_write.utils.batching import MicroBatcher
+from braze_mcp_write.utils.jobs import JobQueue
 from braze_mcp_write.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class HTTPClientConfig:
+    """
+    Connection pool, protocol and timeout settings for the shared HTTP client.
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    warmup_connections: int = 1
+
+    @classmethod
+    def from_env(cls) -> "HTTPClientConfig":
+        """
+        Build the configuration from BRAZE_HTTP_* environment variables.
+        
+        Returns:
+            HTTPClientConfig with defaults for any unset variable
+        """
+        return cls(
+            max_connections=int(os.getenv("BRAZE_HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(
+                os.getenv("BRAZE_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+            ),
+            keepalive_expiry=float(os.getenv("BRAZE_HTTP_KEEPALIVE_EXPIRY", "30")),
+            http2=os.getenv("BRAZE_HTTP2", "false").lower() == "true",
+            connect_timeout=float(os.getenv("BRAZE_HTTP_CONNECT_TIMEOUT", "10")),
+            read_timeout=float(os.getenv("BRAZE_HTTP_READ_TIMEOUT", "30")),
+            write_timeout=float(os.getenv("BRAZE_HTTP_WRITE_TIMEOUT", "30")),
+            pool_timeout=float(os.getenv("BRAZE_HTTP_POOL_TIMEOUT", "10")),
+            warmup_connections=int(os.getenv("BRAZE_HTTP_WARMUP_CONNECTIONS", "1")),
+        )
+
+
 @dataclass
 class BrazeContext:
     """
@@ -25,6 +68,10 @@ class BrazeContext:
     api_key: str
     base_url: str
     http_client: httpx.AsyncClient
+    http_config: HTTPClientConfig = field(default_factory=HTTPClientConfig)
+    jobs: JobQueue | None = None
+    # Request coalescers bound to this context's HTTP client, keyed by endpoint
+    batchers: dict[str, MicroBatcher] = field(default_factory=dict)
 
 
 def get_braze_context(ctx: Context) -> BrazeContext:
@@ -48,13 +95,143 @@ def get_braze_context(ctx: Context) -> BrazeContext:
     return ctx.request_context
 
 
+def get_job_queue(ctx: Context) -> JobQueue:
+    """
+    Extract the background job queue from MCP context.
+    
+    Args:
+        ctx: MCP context
+    
+    Returns:
+        The JobQueue started by braze_lifespan
+    
+    Raises:
+        ValueError: If the job queue could not be started
+    """
+    jobs = get_braze_context(ctx).jobs
+    if jobs is None:
+        raise ValueError("The job queue is not available (see the server logs for details)")
+    return jobs
+
+
+def create_http_client(api_key: str, config: HTTPClientConfig) -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client for Braze API requests.
+    
+    Args:
+        api_key: Braze REST API key
+        config: Connection pool, protocol and timeout settings
+    
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "BRAZE_HTTP2=true but the 'h2' package is not installed; falling back to HTTP/1.1. "
+            "Install with: pip install 'httpx[http2]'"
+        )
+        config.http2 = False
+    
+    logger.info(
+        f"HTTP client: max_connections={config.max_connections}, "
+        f"max_keepalive_connections={config.max_keepalive_connections}, "
+        f"keepalive_expiry={config.keepalive_expiry}s, http2={config.http2}"
+    )
+    
+    return httpx.AsyncClient(
+        http2=config.http2,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=config.connect_timeout,
+            read=config.read_timeout,
+            write=config.write_timeout,
+            pool=config.pool_timeout,
+        ),
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+    )
+
+
+async def warm_up_connections(client: httpx.AsyncClient, base_url: str, count: int) -> None:
+    """
+    Open keep-alive connections to the Braze API ahead of the first tool call.
+    
+    Sends lightweight HEAD requests so TCP and TLS handshakes happen at startup.
+    Failures are logged and otherwise ignored.
+    
+    Args:
+        client: HTTP client to warm up
+        base_url: Base URL for the Braze API
+        count: Number of connections to open (0 disables warm-up)
+    """
+    if count <= 0:
+        return
+    
+    results = await asyncio.gather(
+        *(client.head(base_url) for _ in range(count)), return_exceptions=True
+    )
+    failures = [r for r in results if isinstance(r, Exception)]
+    
+    if failures:
+        logger.warning(
+            f"Connection warm-up failed for {len(failures)}/{count} connections: {failures[0]}"
+        )
+    else:
+        logger.info(f"Warmed up {count} connection(s) to {base_url}")
+
+
+def get_pool_stats(braze_ctx: BrazeContext) -> dict[str, Any]:
+    """
+    Report connection pool usage of the shared HTTP client.
+    
+    Args:
+        braze_ctx: Braze context owning the HTTP client
+    
+    Returns:
+        Dictionary with pool configuration and per-state connection counts
+    """
+    stats: dict[str, Any] = {"config": asdict(braze_ctx.http_config)}
+    
+    # httpx does not expose pool state publicly; read it from the httpcore pool
+    pool = getattr(getattr(braze_ctx.http_client, "_transport", None), "_pool", None)
+    if pool is None:
+        stats["available"] = False
+        return stats
+    
+    connections = list(pool.connections)
+    protocols: dict[str, int] = {}
+    for connection in connections:
+        protocol = connection.info().split(",", 1)[0]
+        protocols[protocol] = protocols.get(protocol, 0) + 1
+    
+    stats.update(
+        {
+            "available": True,
+            "connections": len(connections),
+            "idle": sum(1 for c in connections if c.is_idle()),
+            "active": sum(1 for c in connections if not c.is_idle() and not c.is_closed()),
+            "available_for_requests": sum(1 for c in connections if c.is_available()),
+            "expired": sum(1 for c in connections if c.has_expired()),
+            "queued_requests": len(getattr(pool, "_requests", [])),
+            "protocols": protocols,
+        }
+    )
+    return stats
+
+
 @asynccontextmanager
 async def braze_lifespan(server: Any) -> AsyncGenerator[BrazeContext, None]:
     """
     Lifespan context manager for the Braze MCP server.
     
-    Initializes HTTP client and validates configuration on startup,
-    cleans up resources on shutdown.
+    Initializes HTTP client, validates configuration and starts the job
+    queue workers on startup, cleans up resources on shutdown.
     
     Args:
         server: The FastMCP server instance
@@ -90,23 +267,31 @@ async def braze_lifespan(server: Any) -> AsyncGenerator[BrazeContext, None]:
     logger.info(f"Write operations enabled: {os.getenv('BRAZE_WRITE_ENABLED', 'false')}")
     
     # Create HTTP client
-    http_client = httpx.AsyncClient(
-        timeout=httpx.Timeout(30.0),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-    )
+    http_config = HTTPClientConfig.from_env()
+    http_client = create_http_client(api_key, http_config)
     
     braze_ctx = BrazeContext(
         api_key=api_key,
         base_url=base_url,
         http_client=http_client,
+        http_config=http_config,
+        jobs=JobQueue(),
     )
     
     try:
+        await warm_up_connections(http_client, base_url, http_config.warmup_connections)
+        try:
+            await braze_ctx.jobs.start(braze_ctx)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Job queue unavailable, bulk jobs are disabled: {e}")
+            braze_ctx.jobs = None
         yield braze_ctx
     finally:
         logger.info("Shutting down Braze MCP Write Server")
+        if braze_ctx.jobs is not None:
+            await braze_ctx.jobs.stop()
+        for batcher in braze_ctx.batchers.values():
+            await batcher.aclose()
+        braze_ctx.batchers.clear()
         await http_client.aclose()
 
@@ -2,46 +2,285 @@
 HTTP utilities for making requests to the Braze API.
 """
 
-import json
+import asyncio
+import gzip
+import os
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from logging import Logger
-from typing import Any, Type, TypeVar
+from typing import Any, Sequence, Type, TypeVar
 
 import httpx
 from pydantic import BaseModel, ValidationError
 
+from braze_mcp_write.utils.cache import cache_key, response_cache, single_flight
 from braze_mcp_write.utils.logging import get_logger
+from braze_mcp_write.utils.safety import acquire_endpoint, rate_limit_budget
+from braze_mcp_write.utils.serialization import (
+    JSONDecodeError,
+    RequestBody,
+    decode_json,
+    encode_body,
+)
 
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# ============================================================================
+# RETRY POLICY
+# ============================================================================
+
+SUPPORTED_METHODS = ("GET", "POST", "PUT", "DELETE")
+
+# Methods that are safe to repeat after an ambiguous failure
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# Transport errors raised before the request reached Braze; always safe to retry
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry settings for Braze API requests.
+    
+    429 responses and connection failures are retried for every method, since
+    Braze did not process the request. 5xx responses and other transport errors
+    are only retried for idempotent requests.
+    """
+    max_attempts: int = int(os.getenv("BRAZE_RETRY_MAX_ATTEMPTS", "4"))
+    base_delay: float = float(os.getenv("BRAZE_RETRY_BASE_DELAY", "0.5"))
+    max_delay: float = float(os.getenv("BRAZE_RETRY_MAX_DELAY", "30"))
+    deadline: float = float(os.getenv("BRAZE_RETRY_DEADLINE", "60"))
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given attempt number."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def _server_retry_delay(response: httpx.Response) -> float | None:
+    """Seconds to wait according to Retry-After or X-RateLimit-Reset headers."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    reset = response.headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+
+    return None
+
+
+# ============================================================================
+# REQUEST COMPRESSION
+# ============================================================================
+
+# Headers of a request with a serialized JSON body
+JSON_HEADERS = {"Content-Type": "application/json"}
+GZIP_JSON_HEADERS = {**JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# Bodies larger than this are compressed in a worker thread to keep the event loop free
+GZIP_THREAD_MIN_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """
+    Gzip settings for request bodies.
+    
+    When enabled, bodies of at least min_bytes are sent with
+    Content-Encoding: gzip. Responses are negotiated separately: httpx sends
+    Accept-Encoding and decompresses gzip/deflate responses transparently.
+    """
+    enabled: bool = os.getenv("BRAZE_GZIP_REQUESTS", "false").lower() == "true"
+    min_bytes: int = int(os.getenv("BRAZE_GZIP_MIN_BYTES", "16384"))
+    level: int = int(os.getenv("BRAZE_GZIP_LEVEL", "6"))
+
+    def applies(self, content: bytes | None) -> bool:
+        """Whether a body should be compressed."""
+        return self.enabled and content is not None and len(content) >= self.min_bytes
+
+
+DEFAULT_COMPRESSION_POLICY = CompressionPolicy()
+
+
+async def compress_body(content: bytes, level: int) -> bytes:
+    """Gzip a request body (deterministically, without a timestamp)."""
+    if len(content) >= GZIP_THREAD_MIN_BYTES:
+        return await asyncio.to_thread(gzip.compress, content, level, mtime=0)
+    return gzip.compress(content, level, mtime=0)
+
+
+# ============================================================================
+# RESPONSE BODIES
+# ============================================================================
+
+# Largest response body read into memory; the rest of a longer body is discarded
+MAX_RESPONSE_BYTES = int(os.getenv("BRAZE_MAX_RESPONSE_BYTES", str(10 * 1024 * 1024)))
+
+# Characters of an undecodable response body included in error results and logs
+RESPONSE_PREVIEW_CHARS = int(os.getenv("BRAZE_RESPONSE_PREVIEW_CHARS", "2000"))
+
+# Response extension set to True when the body was cut off at MAX_RESPONSE_BYTES
+TRUNCATED_EXTENSION = "braze_truncated"
+
+# Headers describing the body on the wire rather than the decoded body kept in memory
+WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+async def read_capped(response: httpx.Response, limit: int = MAX_RESPONSE_BYTES) -> httpx.Response:
+    """
+    Read a streamed response, keeping at most `limit` bytes of its decoded body.
+    
+    An oversized body is not downloaded past the limit: the connection is
+    released as soon as the limit is reached.
+    
+    Args:
+        response: Response opened with stream=True
+        limit: Maximum number of body bytes to keep
+    
+    Returns:
+        Fully read response with the (possibly truncated) body; the
+        TRUNCATED_EXTENSION extension tells whether it was cut off
+    """
+    chunks: list[bytes] = []
+    size = 0
+    truncated = False
+    try:
+        async for chunk in response.aiter_bytes():
+            if size + len(chunk) > limit:
+                chunks.append(chunk[: limit - size])
+                truncated = True
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+    finally:
+        await response.aclose()
+    
+    if truncated:
+        logger.warning(
+            f"Response from {response.request.method} {response.request.url} exceeds "
+            f"{limit} bytes; body truncated"
+        )
+    
+    return httpx.Response(
+        response.status_code,
+        headers=[
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in WIRE_HEADERS
+        ],
+        content=b"".join(chunks),
+        request=response.request,
+        extensions={**response.extensions, TRUNCATED_EXTENSION: truncated},
+    )
+
+
+def response_preview(response: httpx.Response, limit: int = RESPONSE_PREVIEW_CHARS) -> str:
+    """
+    Short text preview of a response body, for error results and logs.
+    
+    Only the start of the body is decoded, so previewing a multi-megabyte
+    HTML error page stays cheap.
+    """
+    content = response.content
+    # A character takes at most 4 bytes in any encoding Braze responses use
+    text = content[: limit * 4].decode(response.encoding or "utf-8", errors="replace")
+    if len(text) <= limit and len(content) <= limit * 4:
+        return text
+    return f"{text[:limit]}... [truncated, {len(content)} bytes total]"
+
+
+def is_truncated(response: httpx.Response) -> bool:
+    """Whether a response body was cut off at MAX_RESPONSE_BYTES."""
+    return bool(response.extensions.get(TRUNCATED_EXTENSION))
+
+
+def is_cacheable(response: httpx.Response) -> bool:
+    """Whether a GET response may be stored in the response cache."""
+    return not is_truncated(response)
+
+
+# ============================================================================
+# REQUESTS
+# ============================================================================
+
 
 async def make_request(
     client: httpx.AsyncClient,
     base_url: str,
     url_path: str,
     params: dict[str, Any] | None = None,
-    body: dict[str, Any] | None = None,
+    body: RequestBody | None = None,
     method: str = "GET",
+    idempotent: bool | None = None,
+    retry: RetryPolicy | None = None,
+    cache: bool = True,
+    compression: CompressionPolicy | None = None,
 ) -> httpx.Response:
     """
     Make an HTTP request to the Braze API.
     
+    Waits for capacity in the endpoint's Braze rate limit bucket before sending,
+    pacing requests by the budget reported in X-RateLimit-* headers. Throttled or
+    failed requests are retried with exponential backoff and jitter, honoring
+    Retry-After and X-RateLimit-Reset headers.
+    
+    Identical concurrent GET requests are sent once and share the response.
+    Successful GET responses are served from the response cache for
+    BRAZE_RESPONSE_CACHE_TTL seconds, and any other request evicts the cached
+    responses of the resource it writes to.
+    
+    The body is serialized once (with orjson when available) and the same bytes
+    are reused for every retry; bytes or str bodies are sent unchanged. With
+    BRAZE_GZIP_REQUESTS enabled, bodies of at least BRAZE_GZIP_MIN_BYTES are
+    sent gzip-compressed. Response bodies are read up to BRAZE_MAX_RESPONSE_BYTES.
+    
     Args:
         client: HTTP client instance
         base_url: Base URL for the Braze API
         url_path: Path to append to base URL
         params: Query parameters (for GET requests)
-        body: Request body (for POST/PUT requests)
+        body: Request body (for POST/PUT requests), as a JSON object or pre-serialized JSON
         method: HTTP method (GET, POST, PUT, DELETE)
+        idempotent: Whether the request is safe to repeat after a 5xx or
+            transport error (defaults to True for GET, PUT and DELETE)
+        retry: Retry policy (defaults to the BRAZE_RETRY_* configuration)
+        cache: Whether a GET response may be served from and stored in the response cache
+        compression: Request body compression policy (defaults to the BRAZE_GZIP_* configuration)
     
     Returns:
         HTTP response object
     
     Raises:
         httpx.HTTPError: If the request fails
+        ValueError: If rate limit capacity is not available within BRAZE_RATE_LIMIT_MAX_WAIT
     """
     url = f"{base_url}/{url_path}"
+    method = method.upper()
+    
+    if method not in SUPPORTED_METHODS:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    policy = retry or DEFAULT_RETRY_POLICY
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
     
     # Remove None values from params
     if params:
@@ -50,27 +289,116 @@ async def make_request(
     logger.debug(f"{method} {url}")
     if params:
         logger.debug(f"Params: {params}")
-    if body:
-        logger.debug(f"Body: {json.dumps(body, indent=2)}")
+    content = encode_body(body)
+    headers = JSON_HEADERS if content is not None else None
+    if content:
+        # Log the size only; re-serializing a large body just to log it doubles its cost
+        size = len(content)
+        compression = compression or DEFAULT_COMPRESSION_POLICY
+        if compression.applies(content):
+            content = await compress_body(content, compression.level)
+            headers = GZIP_JSON_HEADERS
+            logger.debug(f"Body: {size} bytes (gzip: {len(content)} bytes)")
+        else:
+            logger.debug(f"Body: {size} bytes")
+    
+    async def send() -> httpx.Response:
+        return await _send_with_retries(
+            client, method, url, url_path, params, content, headers, idempotent, policy
+        )
+    
+    if method == "GET":
+        key = cache_key(base_url, url_path, params)
+        if cache and response_cache.enabled:
+            return await response_cache.fetch(key, send, is_cacheable)
+        # Identical GETs already in flight share one request even when not cached
+        return await single_flight.run(key, send)
     
     try:
-        if method.upper() == "GET":
-            response = await client.get(url, params=params)
-        elif method.upper() == "POST":
-            response = await client.post(url, json=body)
-        elif method.upper() == "PUT":
-            response = await client.put(url, json=body)
-        elif method.upper() == "DELETE":
-            response = await client.delete(url, json=body)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        response.raise_for_status()
-        return response
+        return await send()
+    finally:
+        # Even a failed write may have been applied, so cached reads are stale either way
+        response_cache.invalidate_for_write(
+            base_url, url_path, body if isinstance(body, dict) else None
+        )
+
+
+async def _send_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    url_path: str,
+    params: dict[str, Any] | None,
+    content: bytes | None,
+    headers: dict[str, str] | None,
+    idempotent: bool,
+    policy: RetryPolicy,
+) -> httpx.Response:
+    """Send a request, retrying it according to the retry policy."""
+    deadline = time.monotonic() + policy.deadline
+    attempt = 0
+    
+    try:
+        while True:
+            attempt += 1
+            await acquire_endpoint(url_path)
+            
+            try:
+                request = client.build_request(
+                    method,
+                    url,
+                    params=params if method == "GET" else None,
+                    content=content,
+                    headers=headers,
+                )
+                response = await read_capped(await client.send(request, stream=True))
+                rate_limit_budget.record(url_path, response.headers)
+            except httpx.TransportError as e:
+                if (
+                    not (idempotent or isinstance(e, UNSENT_REQUEST_ERRORS))
+                    or attempt >= policy.max_attempts
+                ):
+                    raise
+                failure: httpx.Response | httpx.TransportError = e
+                delay = policy.backoff(attempt)
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                status = response.status_code
+                if (
+                    response.is_success
+                    or status not in policy.retry_statuses
+                    or (status != 429 and not idempotent)
+                    or attempt >= policy.max_attempts
+                ):
+                    response.raise_for_status()
+                    return response
+                failure = response
+                server_delay = _server_retry_delay(response)
+                delay = (
+                    server_delay + random.uniform(0, policy.base_delay)
+                    if server_delay is not None
+                    else policy.backoff(attempt)
+                )
+                reason = f"HTTP {status}"
+            
+            if time.monotonic() + delay > deadline:
+                logger.warning(
+                    f"Giving up on {method} {url} after {attempt} attempt(s): "
+                    f"retry delay {delay:.1f}s exceeds the {policy.deadline:.0f}s deadline"
+                )
+                if isinstance(failure, httpx.Response):
+                    failure.raise_for_status()
+                raise failure
+            
+            logger.warning(
+                f"{reason} for {method} {url}, retrying in {delay:.2f}s "
+                f"(attempt {attempt}/{policy.max_attempts})"
+            )
+            await asyncio.sleep(delay)
     
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP {e.response.status_code} error for {url}")
-        logger.error(f"Response: {e.response.text}")
+        logger.error(f"Response: {response_preview(e.response)}")
         raise
     except httpx.HTTPError as e:
         logger.error(f"HTTP error for {url}: {e}")
@@ -82,26 +410,39 @@ def handle_response(
     model: Type[T] | Type[dict],
     operation: str,
     logger_instance: Logger,
+    fields: Sequence[str] | None = None,
 ) -> T | dict[str, Any]:
     """
     Handle and parse an HTTP response.
     
+    Bodies that cannot be decoded (including bodies truncated at
+    BRAZE_MAX_RESPONSE_BYTES) produce an error dict with a short preview of
+    the raw body instead of the whole text.
+    
     Args:
         response: HTTP response object
         model: Pydantic model class or dict for parsing
         operation: Description of the operation (for logging)
         logger_instance: Logger instance for error reporting
+        fields: Top-level fields to keep in a dict result, e.g. ("message", "errors")
+            for write acknowledgements; other fields are dropped
     
     Returns:
         Parsed response as the specified model type or dict
     """
+    if is_truncated(response):
+        logger_instance.error(
+            f"Response for {operation} exceeds {MAX_RESPONSE_BYTES} bytes and was not parsed"
+        )
+        return _undecodable_response(response, operation, "Response too large")
+    
     try:
-        data = response.json()
+        data = decode_json(response.content)
         
         # If model is dict, return raw data
         if model is dict:
             logger_instance.debug(f"Successfully completed {operation}")
-            return data
+            return _select_fields(data, fields)
         
         # Try to parse with Pydantic model
         try:
@@ -113,13 +454,25 @@ def handle_response(
                 f"Failed to parse response for {operation} with model {model.__name__}: {e}"
             )
             logger_instance.warning("Returning raw response data instead")
-            return data
+            return _select_fields(data, fields)
     
-    except json.JSONDecodeError as e:
+    except JSONDecodeError as e:
         logger_instance.error(f"Failed to decode JSON response for {operation}: {e}")
-        return {
-            "error": "Failed to decode response",
-            "operation": operation,
-            "raw_response": response.text,
-        }
+        return _undecodable_response(response, operation, "Failed to decode response")
+
+
+def _select_fields(data: Any, fields: Sequence[str] | None) -> Any:
+    if fields is None or not isinstance(data, dict):
+        return data
+    return {field: data[field] for field in fields if field in data}
+
 
+def _undecodable_response(response: httpx.Response, operation: str, error: str) -> dict[str, Any]:
+    return {
+        "error": error,
+        "operation": operation,
+        "status_code": response.status_code,
+        "raw_response": response_preview(response),
+        "raw_response_bytes": len(response.content),
+        "truncated": is_truncated(response),
+    }
@@ -0,0 +1,243 @@
+"""
+Idempotency keys and result deduplication for write operations.
+
+A write call is deduplicated only when the caller gives it an idempotency key;
+the key is bound to a hash of the function name and its canonicalized
+parameters, so it cannot be reused for a different call. Successful results
+are kept for BRAZE_IDEMPOTENCY_TTL seconds in an in-memory LRU cache (and
+optionally an on-disk SQLite store shared across restarts), so a retried call
+returns the stored result instead of sending the request to Braze again. A
+duplicate that arrives while the original call is still running waits for it.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from braze_mcp_write.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Seconds a successful write result is replayed for duplicates (0 disables deduplication)
+IDEMPOTENCY_TTL = float(os.getenv("BRAZE_IDEMPOTENCY_TTL", "600"))
+
+# Maximum number of results kept in memory
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("BRAZE_IDEMPOTENCY_CACHE_SIZE", "1000"))
+
+# Optional SQLite file that keeps results across server restarts
+IDEMPOTENCY_STORE_PATH = os.getenv("BRAZE_IDEMPOTENCY_STORE")
+
+
+class IdempotencyConflictError(ValueError):
+    """An idempotency key was reused with different parameters."""
+
+
+def canonical_fingerprint(function_name: str, parameters: dict[str, Any]) -> str:
+    """
+    Hash a function call independently of parameter order.
+
+    Args:
+        function_name: Name of the function being called
+        parameters: Call parameters
+
+    Returns:
+        SHA-256 hex digest of the function name and canonical JSON parameters
+    """
+    canonical = json.dumps(
+        [function_name, parameters], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+
+class IdempotencyCache:
+    """TTL + LRU cache of write results, with an optional SQLite store."""
+
+    def __init__(
+        self,
+        ttl: float = IDEMPOTENCY_TTL,
+        max_entries: int = IDEMPOTENCY_CACHE_SIZE,
+        store_path: str | os.PathLike | None = IDEMPOTENCY_STORE_PATH,
+    ):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.store_path = Path(store_path).expanduser() if store_path else None
+        self._entries: OrderedDict[str, tuple[float, str, Any]] = OrderedDict()
+        self._in_flight: dict[str, tuple[str, asyncio.Future]] = {}
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def run(
+        self,
+        key: str,
+        fingerprint: str,
+        call: Callable[[], Awaitable[Any]],
+        is_success: Callable[[Any], bool],
+    ) -> tuple[Any, bool]:
+        """
+        Run a call once per idempotency key.
+
+        Args:
+            key: Idempotency key
+            fingerprint: canonical_fingerprint() of the call the key was given for
+            call: Runs the write operation
+            is_success: Decides whether a result is stored for replay
+
+        Returns:
+            Tuple of (result, replayed), where replayed is True if the result
+            came from an earlier call with the same key
+
+        Raises:
+            IdempotencyConflictError: If the key was used for a different call
+        """
+        cached = self._get(key)
+        if cached is not None:
+            self._check_fingerprint(key, fingerprint, cached[0])
+            self.hits += 1
+            return cached[1], True
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._check_fingerprint(key, fingerprint, in_flight[0])
+            self.hits += 1
+            return await asyncio.shield(in_flight[1]), True
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            if is_success(result):
+                self._put(key, fingerprint, result)
+            return result, False
+        finally:
+            self._in_flight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and cache occupancy."""
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "store": str(self.store_path) if self.store_path else None,
+        }
+
+    @staticmethod
+    def _check_fingerprint(key: str, expected: str, actual: str) -> None:
+        if expected != actual:
+            raise IdempotencyConflictError(
+                f"Idempotency key '{key}' was already used with different parameters"
+            )
+
+    def _get(self, key: str) -> tuple[str, Any] | None:
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1], entry[2]
+            del self._entries[key]
+
+        stored = self._load(key, now)
+        if stored is not None:
+            self._remember(key, *stored)
+            return stored[1], stored[2]
+        return None
+
+    def _put(self, key: str, fingerprint: str, result: Any) -> None:
+        expires_at = time.time() + self.ttl
+        self._remember(key, expires_at, fingerprint, result)
+        self._save(key, expires_at, fingerprint, result)
+
+    def _remember(self, key: str, expires_at: float, fingerprint: str, result: Any) -> None:
+        self._entries[key] = (expires_at, fingerprint, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # On-disk store
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self.store_path is None:
+            return None
+        if self._db is None:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.store_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+                "fingerprint TEXT NOT NULL, result TEXT NOT NULL)"
+            )
+        return self._db
+
+    def _load(self, key: str, now: float) -> tuple[float, str, Any] | None:
+        try:
+            with self._db_lock:
+                db = self._connect()
+                if db is None:
+                    return None
+                row = db.execute(
+                    "SELECT expires_at, fingerprint, result FROM results "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Idempotency store read failed: {e}")
+            return None
+        return (row[0], row[1], json.loads(row[2])) if row else None
+
+    def _save(self, key: str, expires_at: float, fingerprint: str, result: Any) -> None:
+        try:
+            with self._db_lock:
+                db = self._connect()
+                if db is None:
+                    return
+                with db:
+                    db.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+                    db.execute(
+                        "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                        (key, expires_at, fingerprint, json.dumps(result, default=str)),
+                    )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Idempotency store write failed: {e}")
+
+
+# Global idempotency cache instance
+idempotency_cache = IdempotencyCache()
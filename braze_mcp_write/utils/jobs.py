@@ -0,0 +1,548 @@
+"""
+Durable job queue for long-running bulk operations.
+
+Jobs are written to a local SQLite database before they run: a job is one
+function call split into chunk calls (e.g. 50 catalog items each), and every
+chunk's outcome is checkpointed as soon as it completes. Background workers
+started by braze_lifespan execute queued jobs.
+
+Several server processes may share the database (MCP hosts start one server
+per session). A job is claimed atomically and leased to the claiming process,
+which renews the lease while the job runs. A job whose owner stopped renewing
+it (e.g. the process crashed) is resumed by any process once the lease has
+expired, from its remaining chunks, so completed chunks are never sent again.
+Only chunks that were in flight when the owner stopped are re-run.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from braze_mcp_write.utils.batching import (
+    CATALOG_ITEMS_BATCH_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_RECIPIENTS_PER_REQUEST,
+    USERS_IDENTIFY_BATCH_SIZE,
+    USERS_TRACK_BATCH_SIZE,
+    chunked,
+    describe_exception,
+)
+from braze_mcp_write.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from braze_mcp_write.utils.context import BrazeContext
+
+logger = get_logger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+JOBS_DB_PATH = Path(
+    os.getenv(
+        "BRAZE_JOBS_DB",
+        str(Path.home() / ".cache" / "braze-mcp-write" / "jobs.sqlite3"),
+    )
+)
+
+# Number of jobs executed at the same time (0 disables the background workers)
+JOB_WORKERS = int(os.getenv("BRAZE_JOB_WORKERS", "2"))
+
+# Seconds an idle worker waits before checking the queue again
+JOB_POLL_INTERVAL = 5.0
+
+# Seconds a running job stays leased to its process without a heartbeat; after
+# that, another process may resume it
+JOB_LEASE_SECONDS = float(os.getenv("BRAZE_JOB_LEASE_SECONDS", "60"))
+
+# List parameters split into checkpointed chunks, per function: (parameters, chunk size).
+# Functions not listed here run as a single chunk.
+JOB_CHUNKING: dict[str, tuple[tuple[str, ...], int]] = {
+    "track_user_data": (("attributes", "events", "purchases"), USERS_TRACK_BATCH_SIZE),
+    "identify_users": (("aliases_to_identify",), USERS_IDENTIFY_BATCH_SIZE),
+    "create_catalog_items": (("items",), CATALOG_ITEMS_BATCH_SIZE),
+    "update_catalog_items": (("items",), CATALOG_ITEMS_BATCH_SIZE),
+    "delete_catalog_items": (("item_ids",), CATALOG_ITEMS_BATCH_SIZE),
+    "trigger_canvas": (("recipients",), MAX_RECIPIENTS_PER_REQUEST),
+    "send_campaign": (("recipients",), MAX_RECIPIENTS_PER_REQUEST),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    function_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_chunks INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    lease_expires_at REAL
+);
+CREATE TABLE IF NOT EXISTS job_chunks (
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    chunk_index INTEGER NOT NULL,
+    parameters TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    PRIMARY KEY (job_id, chunk_index)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, created_at);
+"""
+
+
+def split_job_parameters(function_name: str, parameters: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Split a function call into the chunk calls of a job.
+
+    Each chunked list parameter is sliced separately; a chunk call carries one
+    slice and none of the function's other chunked lists.
+
+    Args:
+        function_name: Name of the registered function
+        parameters: Parameters of the full call
+
+    Returns:
+        Parameters of each chunk call, in execution order
+    """
+    list_parameters, size = JOB_CHUNKING.get(function_name, ((), 0))
+    present = [name for name in list_parameters if isinstance(parameters.get(name), list)]
+    if not present:
+        return [parameters]
+
+    base = {key: value for key, value in parameters.items() if key not in list_parameters}
+    return [
+        {**base, name: list(chunk)}
+        for name in present
+        for _, chunk in chunked(parameters[name], size)
+    ]
+
+
+# ============================================================================
+# JOB QUEUE
+# ============================================================================
+
+
+class JobQueue:
+    """SQLite-backed job queue with chunk checkpoints and asyncio workers."""
+
+    def __init__(self, path: Path = JOBS_DB_PATH, workers: int = JOB_WORKERS):
+        self.path = path
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+        # Identifies this process as the owner of the jobs it claims
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def open(self) -> None:
+        """Open (and create if needed) the job database."""
+        if self._db is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+        # Databases created before job leases lack the owner columns
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in (("owner", "TEXT"), ("lease_expires_at", "REAL")):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+
+    async def start(self, braze_ctx: "BrazeContext") -> None:
+        """
+        Start the background workers.
+
+        Running jobs whose lease has expired (their process stopped) are
+        resumed by the workers; their completed chunks are kept and only the
+        remaining chunks are executed. Jobs still leased to another live
+        process are left alone.
+
+        Args:
+            braze_ctx: Braze context the jobs run with
+        """
+        self.open()
+        with self._lock:
+            expired = self._db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'running' "
+                "AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+                (time.time(),),
+            ).fetchone()[0]
+        if expired:
+            logger.info(f"Resuming {expired} interrupted job(s)")
+
+        self._wakeup = asyncio.Event()
+        ctx = SimpleNamespace(request_context=braze_ctx)
+        self._tasks = [
+            asyncio.create_task(self._worker(ctx), name=f"braze-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} job worker(s) using {self.path}")
+
+    async def stop(self) -> None:
+        """
+        Stop the workers and close the database.
+
+        Jobs this process was running are released, so any server process
+        (including this one after a restart) resumes them right away.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._db is not None:
+            with self._lock:
+                self._release_jobs()
+                self._db.close()
+            self._db = None
+
+    # ------------------------------------------------------------------
+    # Job management
+    # ------------------------------------------------------------------
+
+    def submit_job(self, function_name: str, chunks: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Persist a job and wake a worker.
+
+        Args:
+            function_name: Registered function each chunk calls
+            chunks: Parameters of each chunk call
+
+        Returns:
+            The queued job's summary
+        """
+        self.open()
+        job_id = uuid.uuid4().hex
+        now = time.time()
+
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.execute(
+                "INSERT INTO jobs (id, function_name, status, total_chunks, created_at, "
+                "updated_at) VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, function_name, len(chunks), now, now),
+            )
+            self._db.executemany(
+                "INSERT INTO job_chunks VALUES (?, ?, ?, 'pending', NULL)",
+                [(job_id, i, json.dumps(chunk)) for i, chunk in enumerate(chunks)],
+            )
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str, include_results: bool = False) -> dict[str, Any] | None:
+        """
+        Get a job's status and chunk progress.
+
+        Args:
+            job_id: Job identifier
+            include_results: If True, include each finished chunk's result
+
+        Returns:
+            Job summary, or None if the job does not exist
+        """
+        self.open()
+        with self._lock:
+            job = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            chunks = self._db.execute(
+                "SELECT chunk_index, status, result FROM job_chunks "
+                "WHERE job_id = ? ORDER BY chunk_index",
+                (job_id,),
+            ).fetchall()
+
+        summary = self._summarize(job, [chunk["status"] for chunk in chunks])
+        if include_results:
+            summary["chunk_results"] = [
+                {
+                    "chunk": chunk["chunk_index"],
+                    "status": chunk["status"],
+                    "result": json.loads(chunk["result"]) if chunk["result"] else None,
+                }
+                for chunk in chunks
+                if chunk["status"] in ("succeeded", "failed")
+            ]
+        return summary
+
+    def list_jobs(self, status: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
+        """
+        List the most recent jobs.
+
+        Args:
+            status: Only list jobs with this status
+            limit: Maximum number of jobs
+
+        Returns:
+            Job summaries, newest first
+        """
+        self.open()
+        with self._lock:
+            jobs = self._db.execute(
+                "SELECT * FROM jobs WHERE ? IS NULL OR status = ? "
+                "ORDER BY created_at DESC LIMIT ?",
+                (status, status, limit),
+            ).fetchall()
+            counts = {
+                job_id: statuses.split(",")
+                for job_id, statuses in self._db.execute(
+                    "SELECT job_id, group_concat(status) FROM job_chunks "
+                    f"WHERE job_id IN ({','.join('?' * len(jobs))}) GROUP BY job_id",
+                    [job["id"] for job in jobs],
+                )
+            }
+
+        return [self._summarize(job, counts.get(job["id"], [])) for job in jobs]
+
+    def cancel_job(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Cancel a queued or running job.
+
+        The cancelled status is written to the database, so the job stops in
+        whichever process is running it. Chunks already sent are not rolled back;
+        chunks not yet started are skipped.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job summary, or None if the job does not exist
+        """
+        self.open()
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id),
+            )
+        return self.get_job(job_id)
+
+    @staticmethod
+    def _summarize(job: sqlite3.Row, chunk_statuses: list[str]) -> dict[str, Any]:
+        return {
+            "job_id": job["id"],
+            "function_name": job["function_name"],
+            "status": job["status"],
+            "total_chunks": job["total_chunks"],
+            "chunks_succeeded": chunk_statuses.count("succeeded"),
+            "chunks_failed": chunk_statuses.count("failed"),
+            "chunks_pending": chunk_statuses.count("pending") + chunk_statuses.count("running"),
+            "created_at": job["created_at"],
+            "updated_at": job["updated_at"],
+        }
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _claim_next(self) -> sqlite3.Row | None:
+        """
+        Claim the oldest queued job, or a running job whose lease expired, and return it.
+
+        The claim is a single conditional UPDATE, so when several processes share
+        the database only one of them gets each job.
+        """
+        claimable = (
+            "(status = 'queued' OR (status = 'running' "
+            "AND (lease_expires_at IS NULL OR lease_expires_at < ?)))"
+        )
+        with self._lock:
+            now = time.time()
+            candidates = self._db.execute(
+                f"SELECT id, status FROM jobs WHERE {claimable} ORDER BY created_at LIMIT 10",
+                (now,),
+            ).fetchall()
+            for candidate in candidates:
+                claimed = self._db.execute(
+                    "UPDATE jobs SET status = 'running', owner = ?, lease_expires_at = ?, "
+                    f"updated_at = ? WHERE id = ? AND {claimable}",
+                    (self.owner, now + JOB_LEASE_SECONDS, now, candidate["id"], now),
+                ).rowcount
+                if not claimed:
+                    continue
+                if candidate["status"] == "running":
+                    # Chunks the previous owner had in flight are run again
+                    self._db.execute(
+                        "UPDATE job_chunks SET status = 'pending' "
+                        "WHERE job_id = ? AND status = 'running'",
+                        (candidate["id"],),
+                    )
+                    logger.info(f"Resuming job {candidate['id']} after its lease expired")
+                return self._db.execute(
+                    "SELECT * FROM jobs WHERE id = ?", (candidate["id"],)
+                ).fetchone()
+        return None
+
+    def _renew_lease(self, job_id: str) -> bool:
+        """Extend this process's lease on a running job; False if the lease was lost."""
+        with self._lock:
+            return bool(
+                self._db.execute(
+                    "UPDATE jobs SET lease_expires_at = ? "
+                    "WHERE id = ? AND owner = ? AND status = 'running'",
+                    (time.time() + JOB_LEASE_SECONDS, job_id, self.owner),
+                ).rowcount
+            )
+
+    def _owns_running_job(self, job_id: str) -> bool:
+        """Whether the job still runs under this process's lease (not cancelled or taken over)."""
+        with self._lock:
+            job = self._db.execute(
+                "SELECT status, owner FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return job is not None and job["status"] == "running" and job["owner"] == self.owner
+
+    async def _heartbeat(self, job_id: str, run: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+            if not self._renew_lease(job_id):
+                # Cancelled, or resumed by another process after a missed renewal:
+                # stop before this process sends chunks the new owner will also send
+                logger.warning(f"Lost the lease on job {job_id}; stopping it")
+                run.cancel()
+                return
+
+    def _release_jobs(self) -> None:
+        """Queue this process's running jobs again (the caller holds the lock)."""
+        owned = [
+            row[0]
+            for row in self._db.execute(
+                "SELECT id FROM jobs WHERE owner = ? AND status = 'running'", (self.owner,)
+            )
+        ]
+        for job_id in owned:
+            self._db.execute(
+                "UPDATE jobs SET status = 'queued', owner = NULL, lease_expires_at = NULL "
+                "WHERE id = ? AND owner = ? AND status = 'running'",
+                (job_id, self.owner),
+            )
+            self._db.execute(
+                "UPDATE job_chunks SET status = 'pending' WHERE job_id = ? AND status = 'running'",
+                (job_id,),
+            )
+
+    def _set_chunk(self, job_id: str, index: int, status: str, result: Any = None) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE job_chunks SET status = ?, result = ? WHERE job_id = ? AND chunk_index = ?",
+                (
+                    status,
+                    None if result is None else json.dumps(result, default=str),
+                    job_id,
+                    index,
+                ),
+            )
+            self._db.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time(), job_id))
+
+    def _finish(self, job_id: str, status: str) -> None:
+        """Record a running job's final status (the caller holds the lock)."""
+        self._db.execute(
+            "UPDATE jobs SET status = ?, updated_at = ?, lease_expires_at = NULL "
+            "WHERE id = ? AND owner = ? AND status = 'running'",
+            (status, time.time(), job_id, self.owner),
+        )
+
+    async def _worker(self, ctx: SimpleNamespace) -> None:
+        while True:
+            job = self._claim_next()
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), JOB_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            run = asyncio.create_task(self._run_job(ctx, job))
+            heartbeat = asyncio.create_task(self._heartbeat(job["id"], run))
+            try:
+                # Unlike awaiting the task, wait() returns when the heartbeat cancels it
+                await asyncio.wait([run])
+            finally:
+                heartbeat.cancel()
+                run.cancel()
+                await asyncio.gather(run, heartbeat, return_exceptions=True)
+
+            if not run.cancelled() and run.exception() is not None:
+                logger.error(f"Job {job['id']} stopped unexpectedly", exc_info=run.exception())
+
+    async def _run_job(self, ctx: SimpleNamespace, job: sqlite3.Row) -> None:
+        """Execute a job's remaining chunks, checkpointing each one as it completes."""
+        from braze_mcp_write.registry_builder import FUNCTION_REGISTRY
+
+        job_id, function_name = job["id"], job["function_name"]
+        if function_name not in FUNCTION_REGISTRY:
+            logger.error(f"Job {job_id} calls unknown function '{function_name}'")
+            with self._lock:
+                self._finish(job_id, "failed")
+            return
+        implementation = FUNCTION_REGISTRY[function_name]["implementation"]
+
+        with self._lock:
+            pending = self._db.execute(
+                "SELECT chunk_index, parameters FROM job_chunks "
+                "WHERE job_id = ? AND status = 'pending' ORDER BY chunk_index",
+                (job_id,),
+            ).fetchall()
+
+        logger.info(f"Running job {job_id} ({function_name}): {len(pending)} chunk(s) remaining")
+        semaphore = asyncio.Semaphore(max(1, MAX_CONCURRENT_REQUESTS))
+
+        async def run_chunk(index: int, parameters: dict[str, Any]) -> None:
+            async with semaphore:
+                if not self._owns_running_job(job_id):
+                    return
+                self._set_chunk(job_id, index, "running")
+                try:
+                    result = await implementation(ctx, **parameters)
+                except Exception as e:
+                    self._set_chunk(job_id, index, "failed", describe_exception(e))
+                    return
+
+                if hasattr(result, "model_dump"):
+                    result = result.model_dump()
+                failed = isinstance(result, dict) and "error" in result
+                self._set_chunk(job_id, index, "failed" if failed else "succeeded", result)
+
+        await asyncio.gather(
+            *(run_chunk(chunk["chunk_index"], json.loads(chunk["parameters"])) for chunk in pending)
+        )
+
+        if not self._owns_running_job(job_id):
+            logger.info(f"Job {job_id} stopped: cancelled or resumed by another process")
+            return
+
+        with self._lock:
+            statuses = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT status FROM job_chunks WHERE job_id = ?", (job_id,)
+                )
+            ]
+            failed = statuses.count("failed")
+            if not failed:
+                status = "succeeded"
+            elif failed == len(statuses):
+                status = "failed"
+            else:
+                status = "partial_success"
+            self._finish(job_id, status)
+
+        logger.info(f"Job {job_id} finished: {status} ({failed}/{len(statuses)} chunks failed)")
@@ -5,11 +5,12 @@ This module provides decorators and utilities to ensure write operations
 are only performed in safe, demo/POC environments.
 """
 
+import asyncio
 import os
-from collections import defaultdict
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from mcp.server.fastmcp import Context
 
@@ -34,21 +35,120 @@ ALLOWED_WORKSPACE_PATTERNS = os.getenv(
 # Rate limits
 MAX_SENDS_PER_HOUR = int(os.getenv("BRAZE_MAX_SENDS_PER_HOUR", "1000"))
 MAX_CATALOG_UPDATES_PER_MIN = int(os.getenv("BRAZE_MAX_CATALOG_UPDATES_PER_MIN", "100"))
+MAX_USER_DELETES_PER_MIN = int(os.getenv("BRAZE_MAX_USER_DELETES_PER_MIN", "1000"))
+MAX_USER_IDENTIFIES_PER_MIN = int(os.getenv("BRAZE_MAX_USER_IDENTIFIES_PER_MIN", "1000"))
+
+# Longest time (seconds) a request waits for rate limit capacity in wait mode
+RATE_LIMIT_MAX_WAIT = float(os.getenv("BRAZE_RATE_LIMIT_MAX_WAIT", "30"))
+
+# Remaining-budget fraction (of X-RateLimit-Limit) below which requests are
+# spread evenly over the time left until the Braze rate limit window resets
+ADAPTIVE_THROTTLE_THRESHOLD = float(os.getenv("BRAZE_ADAPTIVE_THROTTLE_THRESHOLD", "0.1"))
+
+# Braze published per-endpoint rate limits as (requests, window_seconds).
+# Endpoints without a dedicated limit share the "default" bucket.
+BRAZE_ENDPOINT_LIMITS: dict[str, tuple[int, int]] = {
+    "users/track": (3000, 3),
+    "users/delete": (20000, 60),
+    "users/identify": (20000, 60),
+    "catalogs/items": (100, 60),
+    "catalogs": (50, 60),
+    "default": (250000, 3600),
+}
 
 # ============================================================================
 # RATE LIMITER
 # ============================================================================
 
 
+class TokenBucket:
+    """
+    Token bucket allowing `limit` requests per `window_seconds`.
+
+    Tokens refill continuously on the monotonic clock, so every check is
+    constant time. Waiting callers reserve a token ahead of time (the balance
+    may go negative), which serves concurrent waiters in arrival order.
+    """
+
+    __slots__ = ("limit", "window_seconds", "rate", "tokens", "updated")
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.rate = limit / window_seconds
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    def configure(self, limit: int, window_seconds: float) -> None:
+        """Apply a new limit, keeping the current token balance."""
+        if (limit, window_seconds) == (self.limit, self.window_seconds):
+            return
+        self._refill()
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.rate = limit / window_seconds
+        self.tokens = min(self.tokens, float(limit))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(float(self.limit), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, max_wait: float = 0.0) -> float | None:
+        """
+        Reserve one token.
+
+        Args:
+            max_wait: Longest acceptable wait (seconds) for the token
+
+        Returns:
+            Seconds the caller must wait before proceeding (0 if a token is
+            available now), or None if the wait would exceed max_wait. No
+            token is taken when None is returned.
+        """
+        self._refill()
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+        if wait > max_wait:
+            return None
+
+        self.tokens -= 1
+        return wait
+
+    def refund(self) -> None:
+        """Return a reserved token that ended up unused."""
+        self._refill()
+        self.tokens = min(float(self.limit), self.tokens + 1)
+
+    def wait_time(self) -> float:
+        """Seconds until the next token becomes available."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    @property
+    def available(self) -> int:
+        """Number of whole tokens currently available."""
+        self._refill()
+        return max(0, int(self.tokens))
+
+
 class RateLimiter:
-    """Simple in-memory rate limiter for write operations."""
+    """In-memory token bucket rate limiter keyed by operation name."""
 
     def __init__(self):
-        self.requests: dict[str, list[datetime]] = defaultdict(list)
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, operation: str, limit: int, window_seconds: float) -> TokenBucket:
+        bucket = self.buckets.get(operation)
+        if bucket is None:
+            bucket = self.buckets[operation] = TokenBucket(limit, window_seconds)
+        else:
+            bucket.configure(limit, window_seconds)
+        return bucket
 
     def check_limit(self, operation: str, limit: int, window_seconds: int) -> tuple[bool, str]:
         """
-        Check if operation is within rate limit.
+        Check if operation is within rate limit (fail-fast mode).
         
         Args:
             operation: Name of the operation being rate limited
@@ -58,30 +158,266 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, message)
         """
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=window_seconds)
-
-        # Clean old requests
-        self.requests[operation] = [t for t in self.requests[operation] if t > cutoff]
-
-        current_count = len(self.requests[operation])
+        bucket = self._bucket(operation, limit, window_seconds)
 
-        if current_count >= limit:
-            wait_time = (self.requests[operation][0] - cutoff).total_seconds()
+        if bucket.reserve() is None:
             return (
                 False,
                 f"Rate limit exceeded for {operation}. "
-                f"{current_count}/{limit} requests in window. "
-                f"Try again in {wait_time:.0f} seconds.",
+                f"Limit is {limit} requests per {window_seconds} seconds. "
+                f"Try again in {bucket.wait_time():.1f} seconds.",
+            )
+
+        return True, f"OK ({bucket.available}/{limit} remaining)"
+
+    async def acquire(
+        self,
+        operation: str,
+        limit: int,
+        window_seconds: float,
+        max_wait: float | None = None,
+    ) -> float:
+        """
+        Wait until the operation is within its rate limit (wait mode).
+        
+        Args:
+            operation: Name of the operation being rate limited
+            limit: Maximum number of requests allowed
+            window_seconds: Time window in seconds
+            max_wait: Longest time to wait in seconds (defaults to BRAZE_RATE_LIMIT_MAX_WAIT)
+        
+        Returns:
+            Number of seconds spent waiting
+        
+        Raises:
+            ValueError: If capacity will not be available within max_wait
+        """
+        budget = RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        bucket = self._bucket(operation, limit, window_seconds)
+
+        wait = bucket.reserve(budget)
+        if wait is None:
+            raise ValueError(
+                f"Rate limit exceeded for {operation}. "
+                f"Capacity not available within {budget:.1f} seconds "
+                f"(next slot in {bucket.wait_time():.1f} seconds)."
             )
 
-        self.requests[operation].append(now)
-        return True, f"OK ({current_count + 1}/{limit})"
+        if wait > 0:
+            logger.debug(f"Waiting {wait:.2f}s for rate limit capacity on {operation}")
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def release(self, operation: str) -> None:
+        """
+        Give back a slot taken by acquire() for a request that was not sent.
+        
+        Args:
+            operation: Name of the operation the slot was acquired for
+        """
+        bucket = self.buckets.get(operation)
+        if bucket is not None:
+            bucket.refund()
 
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
+
+def endpoint_family(url_path: str) -> str:
+    """
+    Map a Braze API path to the endpoint family that shares its rate limit.
+    
+    Args:
+        url_path: API path relative to the base URL (e.g. "users/track")
+    
+    Returns:
+        Key into BRAZE_ENDPOINT_LIMITS
+    """
+    segments = url_path.strip("/").split("?", 1)[0].split("/")
+
+    if segments[0] == "catalogs":
+        return "catalogs/items" if "items" in segments[2:3] else "catalogs"
+
+    family = "/".join(segments[:2])
+    return family if family in BRAZE_ENDPOINT_LIMITS else "default"
+
+
+class EndpointBudget:
+    """Rate limit budget last reported by Braze for one endpoint family."""
+
+    __slots__ = ("limit", "remaining", "reset_at", "updated", "next_dispatch")
+
+    def __init__(self):
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at = 0.0  # monotonic time at which the window resets
+        self.updated = 0.0
+        self.next_dispatch = 0.0
+
+
+class RateLimitBudget:
+    """
+    Adaptive throttle driven by Braze X-RateLimit-* response headers.
+    
+    Every response updates the remaining budget of its endpoint family. Before
+    dispatch, requests are paced evenly over the rest of the window once the
+    budget drops below ADAPTIVE_THROTTLE_THRESHOLD, and held until the reset
+    once it is exhausted, so requests slow down before Braze rejects them.
+    """
+
+    def __init__(self):
+        self.budgets: dict[str, EndpointBudget] = {}
+
+    def record(self, url_path: str, headers: Mapping[str, str]) -> None:
+        """
+        Update the budget of an endpoint family from response headers.
+        
+        Args:
+            url_path: API path the response belongs to
+            headers: Response headers
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        try:
+            budget = self.budgets.setdefault(endpoint_family(url_path), EndpointBudget())
+            now = time.monotonic()
+            budget.remaining = int(remaining)
+            if headers.get("X-RateLimit-Limit"):
+                budget.limit = int(headers["X-RateLimit-Limit"])
+            if headers.get("X-RateLimit-Reset"):
+                budget.reset_at = now + max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+            budget.updated = now
+        except ValueError:
+            logger.debug(f"Ignoring malformed rate limit headers for {url_path}")
+
+    def _delay(self, budget: EndpointBudget, now: float) -> float:
+        """Seconds the next request should wait, reserving its slot."""
+        if budget.remaining is None or now >= budget.reset_at:
+            return 0.0
+
+        time_left = budget.reset_at - now
+
+        if budget.remaining <= 0:
+            return time_left
+
+        if budget.limit and budget.remaining < budget.limit * ADAPTIVE_THROTTLE_THRESHOLD:
+            start = max(now, budget.next_dispatch)
+            budget.next_dispatch = start + time_left / budget.remaining
+            budget.remaining -= 1
+            return start - now
+
+        budget.remaining -= 1
+        return 0.0
+
+    async def throttle(self, url_path: str, max_wait: float | None = None) -> float:
+        """
+        Wait as long as the remaining Braze budget requires before dispatch.
+        
+        Args:
+            url_path: API path about to be requested
+            max_wait: Longest time to wait in seconds (defaults to BRAZE_RATE_LIMIT_MAX_WAIT)
+        
+        Returns:
+            Number of seconds spent waiting
+        
+        Raises:
+            ValueError: If the budget will not recover within max_wait
+        """
+        family = endpoint_family(url_path)
+        budget = self.budgets.get(family)
+        if budget is None:
+            return 0.0
+
+        budget_wait = RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        reserved = (budget.remaining, budget.next_dispatch)
+        wait = self._delay(budget, time.monotonic())
+
+        if wait > budget_wait:
+            # This request won't be sent; undo the slot _delay reserved for it
+            budget.remaining, budget.next_dispatch = reserved
+            raise ValueError(
+                f"Braze rate limit budget exhausted for {family}. "
+                f"Window resets in {wait:.1f} seconds, more than the {budget_wait:.1f} second limit."
+            )
+
+        if wait > 0:
+            logger.info(f"Throttling {family} request for {wait:.2f}s (Braze budget low)")
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Report the live budget of every endpoint family seen so far.
+        
+        Returns:
+            Dictionary keyed by endpoint family with limit, remaining budget,
+            seconds until reset and whether requests are being throttled
+        """
+        now = time.monotonic()
+        report = {}
+
+        for family, budget in self.budgets.items():
+            resets_in = max(0.0, budget.reset_at - now)
+            remaining = budget.remaining if resets_in > 0 else budget.limit
+            report[family] = {
+                "limit": budget.limit,
+                "remaining": remaining,
+                "resets_in_seconds": round(resets_in, 1),
+                "throttling": bool(
+                    resets_in > 0
+                    and remaining is not None
+                    and budget.limit
+                    and remaining < budget.limit * ADAPTIVE_THROTTLE_THRESHOLD
+                ),
+                "updated_seconds_ago": round(now - budget.updated, 1),
+            }
+
+        return report
+
+
+# Global budget tracker fed by make_request
+rate_limit_budget = RateLimitBudget()
+
+
+async def acquire_endpoint(url_path: str, max_wait: float | None = None) -> float:
+    """
+    Wait for capacity to send a request to a Braze endpoint.
+    
+    Applies the static Braze published limit for the endpoint family, then the
+    adaptive throttle based on the budget Braze last reported; max_wait caps the
+    two waits combined. If the throttle gives up (or the wait is cancelled), the
+    static slot is given back.
+    
+    Args:
+        url_path: API path relative to the base URL
+        max_wait: Longest time to wait in seconds (defaults to BRAZE_RATE_LIMIT_MAX_WAIT)
+    
+    Returns:
+        Number of seconds spent waiting
+    
+    Raises:
+        ValueError: If capacity will not be available within max_wait
+    """
+    family = endpoint_family(url_path)
+    limit, window_seconds = BRAZE_ENDPOINT_LIMITS[family]
+    operation = f"endpoint:{family}"
+    if max_wait is None:
+        max_wait = RATE_LIMIT_MAX_WAIT
+    waited = await rate_limiter.acquire(operation, limit, window_seconds, max_wait)
+    max_wait = max(0.0, max_wait - waited)
+
+    try:
+        return waited + await rate_limit_budget.throttle(url_path, max_wait)
+    except BaseException:
+        # No request will be sent for this slot
+        rate_limiter.release(operation)
+        raise
+
 # ============================================================================
 # VALIDATION DECORATORS
 # ============================================================================
@@ -186,13 +522,21 @@ def require_confirmation(operation_type: str = "destructive"):
     return decorator
 
 
-def rate_limit(limit: int, window_seconds: int):
+def rate_limit(
+    limit: int,
+    window_seconds: int,
+    wait: bool = False,
+    max_wait: float | None = None,
+):
     """
     Decorator factory for rate limiting write operations.
     
     Args:
         limit: Maximum number of requests allowed
         window_seconds: Time window in seconds
+        wait: If True, wait for capacity instead of failing immediately
+        max_wait: Longest time to wait in seconds when wait=True
+            (defaults to BRAZE_RATE_LIMIT_MAX_WAIT)
     """
 
     def decorator(func: Callable) -> Callable:
@@ -200,6 +544,20 @@ def rate_limit(limit: int, window_seconds: int):
         async def wrapper(*args, **kwargs):
             operation_name = func.__name__
 
+            if wait:
+                try:
+                    waited = await rate_limiter.acquire(
+                        operation_name, limit, window_seconds, max_wait
+                    )
+                except ValueError as e:
+                    logger.error(f"Rate limit exceeded for {operation_name}: {e}")
+                    raise
+
+                logger.debug(
+                    f"Rate limit check passed for {operation_name} after waiting {waited:.2f}s"
+                )
+                return await func(*args, **kwargs)
+
             is_allowed, message = rate_limiter.check_limit(
                 operation_name, limit, window_seconds
             )
@@ -266,6 +624,8 @@ def safe_write_operation(
     rate_limit_count: int | None = None,
     rate_limit_window: int | None = None,
     require_confirm: bool = False,
+    rate_limit_wait: bool = False,
+    rate_limit_max_wait: float | None = None,
 ):
     """
     Combined decorator that applies all safety checks for write operations.
@@ -274,6 +634,8 @@ def safe_write_operation(
         rate_limit_count: Max requests allowed (None = no limit)
         rate_limit_window: Time window in seconds (None = no limit)
         require_confirm: Whether to require explicit confirmation
+        rate_limit_wait: If True, wait for rate limit capacity instead of failing fast
+        rate_limit_max_wait: Longest time to wait for capacity in seconds
     
     Example:
         @safe_write_operation(rate_limit_count=100, rate_limit_window=3600, require_confirm=True)
@@ -290,7 +652,9 @@ def safe_write_operation(
 
         # 2. Rate limiting
         if rate_limit_count and rate_limit_window:
-            wrapped = rate_limit(rate_limit_count, rate_limit_window)(wrapped)
+            wrapped = rate_limit(
+                rate_limit_count, rate_limit_window, rate_limit_wait, rate_limit_max_wait
+            )(wrapped)
 
         # 3. Confirmation requirement
         if require_confirm:
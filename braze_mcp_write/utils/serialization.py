@@ -0,0 +1,102 @@
+"""
+JSON encoding and decoding for Braze API payloads.
+
+Request bodies are serialized once, to bytes, before they are sent, and those
+bytes are reused across retries. orjson is used when it is installed (the
+`fast` extra) and BRAZE_FAST_JSON is not disabled; otherwise the standard
+library json module is used. Both backends produce compact UTF-8 JSON.
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Use orjson for request and response bodies when it is installed
+FAST_JSON = os.getenv("BRAZE_FAST_JSON", "true").lower() == "true"
+
+JSON_BACKEND = "orjson" if orjson is not None and FAST_JSON else "json"
+
+# Both backends raise a subclass of this on malformed input
+JSONDecodeError = json.JSONDecodeError
+
+# Request body accepted by make_request: a JSON object, or an already serialized one
+RequestBody = dict[str, Any] | list[Any] | bytes | bytearray | memoryview | str
+
+# ============================================================================
+# ENCODING / DECODING
+# ============================================================================
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable value
+
+    Returns:
+        Encoded JSON bytes
+
+    Raises:
+        TypeError: If the value is not JSON-serializable
+    """
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            # orjson rejects a few values the json module accepts (e.g. non-string
+            # keys, integers over 64 bits); let the json module handle those
+            pass
+
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Parse JSON from bytes or text.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded value
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(data)
+
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def encode_body(body: RequestBody | None) -> bytes | None:
+    """
+    Encode a request body, passing already serialized bodies through unchanged.
+
+    Args:
+        body: JSON object, or pre-serialized JSON as bytes or str
+
+    Returns:
+        Encoded body, or None if there is no body
+    """
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, (bytearray, memoryview)):
+        return bytes(body)
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    return encode_json(body)
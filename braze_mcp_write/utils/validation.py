@@ -0,0 +1,142 @@
+"""
+Local JSON Schema validation for function parameters.
+
+Covers the JSON Schema subset emitted by the registry builder and by Pydantic
+(type, enum, const, anyOf/oneOf/allOf, $ref to $defs, properties, required,
+additionalProperties, items and basic length/range bounds), so malformed
+parameters are rejected before any request is sent to Braze.
+"""
+
+from typing import Any
+
+JSON_TYPE_CHECKS = {
+    "null": lambda v: v is None,
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "string": lambda v: isinstance(v, str),
+    "array": lambda v: isinstance(v, (list, tuple)),
+    "object": lambda v: isinstance(v, dict),
+}
+
+
+def _describe_type(value: Any) -> str:
+    """Name the JSON type of a Python value for error messages"""
+    for json_type, check in JSON_TYPE_CHECKS.items():
+        if json_type != "integer" and check(value):
+            return json_type
+    return type(value).__name__
+
+
+def validate_json_schema(
+    value: Any,
+    schema: dict[str, Any],
+    path: str = "$",
+    defs: dict[str, Any] | None = None,
+) -> list[str]:
+    """
+    Validate a value against a JSON Schema.
+
+    Args:
+        value: Value to validate
+        schema: JSON Schema to validate against
+        path: JSON path of the value, used in error messages
+        defs: Definitions available to $ref (collected from enclosing schemas)
+
+    Returns:
+        List of error messages (empty if the value is valid)
+    """
+    if "$defs" in schema:
+        defs = {**(defs or {}), **schema["$defs"]}
+
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        if defs and name in defs:
+            return validate_json_schema(value, defs[name], path, defs)
+        return []
+
+    if "anyOf" in schema or "oneOf" in schema:
+        options = schema.get("anyOf") or schema.get("oneOf")
+        option_errors = [validate_json_schema(value, option, path, defs) for option in options]
+        if all(option_errors):
+            # Report the closest match: the option with the fewest errors
+            return min(option_errors, key=len)
+
+    for option in schema.get("allOf", []):
+        errors = validate_json_schema(value, option, path, defs)
+        if errors:
+            return errors
+
+    if "const" in schema and value != schema["const"]:
+        return [f"{path}: must be {schema['const']!r}"]
+
+    if "enum" in schema and value not in schema["enum"]:
+        return [f"{path}: must be one of {schema['enum']}, got {value!r}"]
+
+    schema_type = schema.get("type")
+    if schema_type is not None:
+        allowed = [schema_type] if isinstance(schema_type, str) else schema_type
+        if not any(JSON_TYPE_CHECKS.get(t, lambda v: True)(value) for t in allowed):
+            return [f"{path}: expected {' or '.join(allowed)}, got {_describe_type(value)}"]
+
+    if isinstance(value, dict):
+        return _validate_object(value, schema, path, defs)
+    if isinstance(value, (list, tuple)):
+        return _validate_array(value, schema, path, defs)
+    if isinstance(value, str):
+        return _validate_bounds(len(value), schema, path, "minLength", "maxLength", "characters")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _validate_bounds(value, schema, path, "minimum", "maximum", "")
+
+    return []
+
+
+def _validate_object(
+    value: dict[str, Any], schema: dict[str, Any], path: str, defs: dict[str, Any] | None
+) -> list[str]:
+    errors = [
+        f"{path}: missing required property '{name}'"
+        for name in schema.get("required", [])
+        if name not in value
+    ]
+
+    properties = schema.get("properties", {})
+    additional = schema.get("additionalProperties", True)
+
+    for key, item in value.items():
+        item_path = f"{path}.{key}"
+        if key in properties:
+            errors.extend(validate_json_schema(item, properties[key], item_path, defs))
+        elif additional is False:
+            errors.append(f"{path}: unexpected property '{key}'")
+        elif isinstance(additional, dict):
+            errors.extend(validate_json_schema(item, additional, item_path, defs))
+
+    return errors
+
+
+def _validate_array(
+    value: list[Any] | tuple[Any, ...],
+    schema: dict[str, Any],
+    path: str,
+    defs: dict[str, Any] | None,
+) -> list[str]:
+    errors = _validate_bounds(len(value), schema, path, "minItems", "maxItems", "items")
+
+    items = schema.get("items")
+    if isinstance(items, dict):
+        for i, item in enumerate(value):
+            errors.extend(validate_json_schema(item, items, f"{path}[{i}]", defs))
+
+    return errors
+
+
+def _validate_bounds(
+    measure: float, schema: dict[str, Any], path: str, low_key: str, high_key: str, unit: str
+) -> list[str]:
+    suffix = f" {unit}" if unit else ""
+    if low_key in schema and measure < schema[low_key]:
+        return [f"{path}: must be at least {schema[low_key]}{suffix}"]
+    if high_key in schema and measure > schema[high_key]:
+        return [f"{path}: must be at most {schema[high_key]}{suffix}"]
+    return []